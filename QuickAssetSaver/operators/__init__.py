@@ -1,6 +1,4 @@
-﻿from . import utils, catalog, file_io, save, bundle, move, delete, manage, swap, metadata  # noqa: F401
-
-import bpy
+﻿import bpy
 
 from .utils import (  # noqa: F401
     DEBUG_MODE,
@@ -10,6 +8,8 @@ from .utils import (  # noqa: F401
     sanitize_name,
     build_asset_filename,
     increment_filename,
+    increment_filename_from_set,
+    scan_existing_filenames,
     MIN_BLEND_FILE_SIZE,
     MAX_INCREMENTAL_FILES,
     LARGE_SELECTION_WARNING_THRESHOLD,
@@ -30,6 +30,7 @@ from .file_io import (  # noqa: F401
     collect_selected_assets_with_names,
     collect_selected_asset_files,
     count_assets_in_blend,
+    count_assets_in_blends,
     write_blend_file,
 )
 
@@ -2,8 +2,16 @@
 Asset bundle operator for Quick Asset Saver.
 """
 
+import functools
+import hashlib
+import os
 import shutil
+import stat
+import sys
+import threading
 import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -11,8 +19,11 @@ import bpy
 from bpy.types import Operator
 
 from .. import properties
+from ..compatibility import is_online_library
+from .file_io import write_blend_file
 from .utils import (
     debug_print,
+    DEBUG_MODE,
     sanitize_name,
     increment_filename,
     MIN_BLEND_FILE_SIZE,
@@ -21,6 +32,210 @@ from .utils import (
     DEFAULT_MAX_BUNDLE_SIZE_MB,
 )
 
+# data_from attributes that are not importable datablock collections
+# (or that would clobber the user's UI/scene if imported)
+_SKIP_COLLECTIONS = frozenset({
+    "workspaces",
+    "screens",
+    "window_managers",
+    "scenes",
+    "version",
+    "filepath",
+    "is_dirty",
+    "is_saved",
+    "use_autopack",
+})
+
+# Datablock collections to import from each file, read once from the RNA
+# definition of bpy.data instead of probing dir(data_from) per file.
+# Non-collection properties (filepath, version, ...) are excluded by type.
+_IMPORT_COLLECTIONS = tuple(
+    prop.identifier for prop in bpy.types.BlendData.bl_rna.properties
+    if prop.type == 'COLLECTION' and prop.identifier not in _SKIP_COLLECTIONS
+)
+
+# stat() is latency bound on network/cold drives, so overlapping the calls
+# scales close to linearly with worker count.
+STAT_MAX_WORKERS = 32
+
+
+# How many files the prefetch thread may run ahead of the import loop, and
+# how much of each file to read where posix_fadvise isn't available
+PREFETCH_AHEAD = 2
+PREFETCH_BYTES = 1 << 20
+
+# Interactive bundling imports this many files per timer tick before
+# handing control back to Blender, so the UI keeps redrawing
+MODAL_BATCH_SIZE = 8
+MODAL_TIMER_INTERVAL = 0.01
+
+# Minimum time between progress indicator updates (~30 Hz)
+PROGRESS_UPDATE_INTERVAL = 1 / 30
+
+# Events still handed to Blender while bundling modally: only viewing the
+# UI, never anything that could edit, undo, save or load the file mid-run
+_NAVIGATION_EVENTS = frozenset({
+    "MOUSEMOVE",
+    "INBETWEEN_MOUSEMOVE",
+    "MIDDLEMOUSE",
+    "WHEELUPMOUSE",
+    "WHEELDOWNMOUSE",
+    "WHEELINMOUSE",
+    "WHEELOUTMOUSE",
+    "TRACKPADPAN",
+    "TRACKPADZOOM",
+    "NDOF_MOTION",
+})
+
+
+def _warm_file(asset_path):
+    """Ask the OS to pull a file into the page cache ahead of libraries.load."""
+    try:
+        if hasattr(os, "posix_fadvise"):
+            fd = os.open(asset_path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+        else:
+            with open(asset_path, "rb") as f:
+                f.read(PREFETCH_BYTES)
+    except OSError:
+        pass
+
+
+def _prefetch_worker(asset_paths, slots, stop):
+    """Warm upcoming files; each one consumes a slot released by the import loop."""
+    for asset_path in asset_paths:
+        slots.acquire()
+        if stop.is_set():
+            return
+        _warm_file(asset_path)
+
+
+# Read size when hashing files to confirm a suspected duplicate
+HASH_CHUNK_BYTES = 1 << 20
+
+# Only this much of each look-alike file is hashed to find likely duplicates;
+# whole files are read only when these prefixes match too
+HEAD_HASH_BYTES = 64 * 1024
+
+
+def _file_digest(asset_path, limit=None):
+    """blake2b digest of a file's contents (or its first limit bytes), or None if unreadable."""
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with open(asset_path, "rb") as f:
+            if limit is not None:
+                digest.update(f.read(limit))
+            else:
+                for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b""):
+                    digest.update(chunk)
+    except OSError:
+        return None
+    return digest.digest()
+
+
+def _digests(paths, limit=None):
+    """{path: _file_digest(path, limit)}, with the reads overlapped on a pool."""
+    if not paths:
+        return {}
+    # Hashing is I/O bound: overlap the reads like the stat() calls
+    workers = min(STAT_MAX_WORKERS, len(paths))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(paths, executor.map(functools.partial(_file_digest, limit=limit), paths)))
+
+
+def _drop_duplicate_files(entries):
+    """Drop byte-identical copies from [(path, size), ...], keeping the first.
+
+    Only files sharing both size and file name are looked at. Their first
+    HEAD_HASH_BYTES are hashed as a cheap pre-filter, and whole files are
+    hashed only where those prefixes collide too.
+
+    Returns:
+        tuple: (kept entries, [(dropped path, path it duplicates), ...])
+    """
+    def group(keys):
+        groups = {}
+        for path, key in keys:
+            groups.setdefault(key, []).append(path)
+        return [paths for paths in groups.values() if len(paths) > 1]
+
+    base_keys = {
+        path: (size, os.path.normcase(os.path.basename(path)))
+        for path, size in entries
+    }
+    suspects = [p for paths in group(base_keys.items()) for p in paths]
+    if not suspects:
+        return entries, []
+
+    heads = _digests(suspects, limit=HEAD_HASH_BYTES)
+    head_keys = {
+        path: base_keys[path] + (heads[path],)
+        for path in suspects if heads[path] is not None
+    }
+
+    # A prefix covering the whole file is already the full digest
+    colliding = [p for paths in group(head_keys.items()) for p in paths]
+    needs_full = [p for p in colliding if base_keys[p][0] > HEAD_HASH_BYTES]
+    fulls = _digests(needs_full)
+
+    kept = []
+    dropped = []
+    first_by_key = {}
+    for path, size in entries:
+        key = head_keys.get(path)
+        if key is not None:
+            if path in fulls:
+                key = key + (fulls[path],) if fulls[path] is not None else None
+            if key is not None:
+                original = first_by_key.setdefault(key, path)
+                if original != path:
+                    debug_print(f"✗ Duplicate of an earlier file, skipping: {path}")
+                    dropped.append((path, original))
+                    continue
+        kept.append((path, size))
+    return kept, dropped
+
+
+@functools.lru_cache(maxsize=64)
+def _resolved(path_str):
+    """Path(path_str).resolve(), memoized: resolving walks every component."""
+    return Path(path_str).resolve()
+
+
+def _is_inside_library(save_path_str, library_path_str):
+    """Whether the bundle folder lies inside the asset library folder."""
+    save_norm = os.path.normcase(os.path.normpath(save_path_str))
+    lib_norm = os.path.normcase(os.path.normpath(library_path_str))
+    # Plain string containment needs no syscalls and settles the common case
+    if save_norm == lib_norm or save_norm.startswith(lib_norm.rstrip(os.sep) + os.sep):
+        return True
+    # Otherwise only symlinks could still place it inside: resolve to be sure
+    try:
+        return _resolved(save_path_str).is_relative_to(_resolved(library_path_str))
+    except (ValueError, OSError):
+        return False
+
+
+def _stat_once(asset_path):
+    """Stat a path once; returns the os.stat_result, or None if it's missing/unreadable."""
+    try:
+        return os.stat(asset_path)
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=64)
+def _list_blends(parent):
+    """List .blend file names in a folder (memoized; cleared per bundle run)."""
+    try:
+        with os.scandir(parent) as entries:
+            return tuple(e.name for e in entries if e.name.lower().endswith(".blend"))
+    except OSError:
+        return ()
+
 
 class QAM_OT_bundle_assets(Operator):
     """Bundle selected assets from a user library into a single .blend file."""
@@ -28,7 +243,24 @@ class QAM_OT_bundle_assets(Operator):
     bl_idname = "qam.bundle_assets"
     bl_label = "Bundle Selected Assets"
     bl_description = "Combine selected assets into a single shareable .blend file"
-    bl_options = {"REGISTER", "UNDO"}
+    # No "UNDO" flag: _finish_bundle pushes the single undo step itself, so
+    # a modal run (which Blender would otherwise also push for) gets one step
+    bl_options = {"REGISTER"}
+
+    # (save_path, library_path) -> "bundle is inside library", so repeat
+    # bundles to the same folder skip resolving both paths; cleared by the
+    # save_path update callback
+    _path_check_cache = {}
+
+    # Per-file progress lines, written to stdout in one go after the import
+    # loop (errors are still printed immediately)
+    _log_buf = None
+
+    # Window-manager timer driving modal() while bundling interactively
+    _timer = None
+
+    # IDs imported so far in this run, removed again if the run is cancelled
+    _imported_ids = None
 
     @classmethod
     def poll(cls, context):
@@ -58,7 +290,6 @@ class QAM_OT_bundle_assets(Operator):
                 return False
 
         # Block online/remote libraries (Blender 5.2+)
-        from ..compatibility import is_online_library
         if is_online_library(context):
             return False
 
@@ -78,8 +309,81 @@ class QAM_OT_bundle_assets(Operator):
 
         return False
 
+    def invoke(self, context, event):
+        """Start bundling as a modal operator so the UI stays responsive."""
+        result = self._begin_bundle(context)
+        if result is not None:
+            return result
+
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(MODAL_TIMER_INTERVAL, window=context.window)
+        wm.modal_handler_add(self)
+        return {"RUNNING_MODAL"}
+
+    def modal(self, context, event):
+        """Import a small batch of files per timer tick, then yield to Blender."""
+        if event.type == "ESC":
+            self._end_import(context)
+            self._discard_imported()
+            self.report({"WARNING"}, "Bundling cancelled")
+            return {"CANCELLED"}
+
+        if event.type != "TIMER":
+            # Swallow everything but view navigation so the file can't be
+            # edited underneath the import
+            if event.type in _NAVIGATION_EVENTS:
+                return {"PASS_THROUGH"}
+            return {"RUNNING_MODAL"}
+
+        try:
+            for _ in range(MODAL_BATCH_SIZE):
+                if not self._import_next(context):
+                    break
+        except (RuntimeError, OSError, MemoryError) as e:
+            self._end_import(context)
+            self._discard_imported()
+            self.report({"ERROR"}, f"Failed to import assets: {e}")
+            traceback.print_exc()
+            return {"CANCELLED"}
+
+        if self._next_index < len(self._queue):
+            return {"RUNNING_MODAL"}
+
+        self._end_import(context)
+        return self._finish_bundle(context)
+
+    def cancel(self, context):
+        """Called by Blender when it ends the modal run itself (e.g. a file load)."""
+        self._end_import(context)
+        self._discard_imported()
+
     def execute(self, context):
-        """Execute the bundling operation."""
+        """Execute the bundling operation in one go (scripts, redo)."""
+        result = self._begin_bundle(context)
+        if result is not None:
+            return result
+
+        try:
+            while self._import_next(context):
+                pass
+        except (RuntimeError, OSError, MemoryError) as e:
+            self._end_import(context)
+            self._discard_imported()
+            self.report({"ERROR"}, f"Failed to import assets: {e}")
+            traceback.print_exc()
+            return {"CANCELLED"}
+
+        self._end_import(context)
+
+        return self._finish_bundle(context)
+
+    def _begin_bundle(self, context):
+        """Validate the selection and set up the import queue.
+
+        Returns:
+            set or None: An operator result to return right away (Current
+            File bundles, errors), or None once files are queued for import
+        """
         wm = context.window_manager
         props = wm.qam_bundler_props
 
@@ -96,28 +400,61 @@ class QAM_OT_bundle_assets(Operator):
         if is_current_file:
             return self._execute_current_file_bundle(context, props)
 
-        selected_assets = self._collect_selected_assets(context)
-
-        if not selected_assets:
-            self.report({"WARNING"}, "No assets selected")
-            return {"CANCELLED"}
-
+        # Resolve the library once and hand it to the collection step
         active_library = self._get_active_library(context)
         if not active_library:
             self.report({"ERROR"}, "Could not determine active asset library")
             return {"CANCELLED"}
 
-        library_path = Path(active_library.path)
+        # Folder listings are only valid for this run
+        _list_blends.cache_clear()
+        library_path_str = str(active_library.path)
+        candidates = self._collect_selected_assets(context, library_path_str)
+
+        if not candidates:
+            self.report({"WARNING"}, "No assets selected")
+            return {"CANCELLED"}
+
+        # Validate against the stat results from collection: no second stat
+        skip_lines = []
+        valid_entries = []
+        for asset_path, st in candidates:
+            is_valid, error_msg = self._validate_asset_file(asset_path, st)
+            if is_valid:
+                valid_entries.append((asset_path, st.st_size))
+            else:
+                skip_lines.append(f"  ✗ Skipping '{asset_path.name}': {error_msg}")
+
+        # Copies of the same file from different folders would otherwise be
+        # loaded twice and bundled as duplicate datablocks
+        unique, duplicates = _drop_duplicate_files(valid_entries)
+        if duplicates:
+            print(f"Skipping {len(duplicates)} duplicate asset file(s)")
+            names = ", ".join(path.name for path, _ in duplicates[:5])
+            more = f" and {len(duplicates) - 5} more" if len(duplicates) > 5 else ""
+            self.report(
+                {"WARNING"},
+                f"Skipped {len(duplicates)} file(s) identical to another selected file: {names}{more}",
+            )
+
+        selected_assets = [asset_path for asset_path, _ in unique]
+        total_bytes = sum(size for _, size in unique)
+        debug_print(f"Total unique .blend files found: {len(selected_assets)}")
+
+        library_path = Path(library_path_str)
         save_path = Path(props.save_path) if props.save_path else Path.home()
 
-        try:
-            if save_path.resolve().is_relative_to(library_path.resolve()):
-                self.report(
-                    {"WARNING"},
-                    "Saving bundle inside asset library directory - this may cause issues",
-                )
-        except (ValueError, OSError):
-            pass
+        path_key = (str(save_path), library_path_str)
+        inside_library = self._path_check_cache.get(path_key)
+        if inside_library is None:
+            inside_library = _is_inside_library(*path_key)
+            self._path_check_cache[path_key] = inside_library
+
+        if inside_library:
+            self.report(
+                {"WARNING"},
+                "Saving bundle inside asset library directory - this may cause issues",
+            )
 
         if len(selected_assets) > LARGE_SELECTION_WARNING_THRESHOLD:
             self.report(
@@ -125,7 +462,7 @@ class QAM_OT_bundle_assets(Operator):
                 f"Bundling {len(selected_assets)} assets - this may take several minutes",
             )
 
-        total_size_mb = self._calculate_total_size(selected_assets)
+        total_size_mb = total_bytes / (1024 * 1024)
         preferences = properties.get_addon_preferences(context)
         max_bundle_size_mb = preferences.max_bundle_size_mb if preferences else DEFAULT_MAX_BUNDLE_SIZE_MB
 
@@ -164,70 +501,171 @@ class QAM_OT_bundle_assets(Operator):
             target_path = base_path
         else:
             target_path = increment_filename(save_path, base_name, ".blend")
-        total_assets = len(selected_assets)
+
+        self._log_buf = skip_lines
+        valid_assets = selected_assets
+
+        self._imported_count = 0
+        self._skipped_count = len(skip_lines)
+        self._error_count = 0
+
+        self._queue = valid_assets
+        self._imported_ids = []
+        self._next_index = 0
+        self._target_path = target_path
+        self._library_path = library_path
+        self._output_name = output_name
+        total_assets = len(valid_assets)
 
         print(f"Importing {total_assets} asset files...")
 
+        # OVERWRITE: snapshot existing datablock names once per collection so
+        # each imported name is a set lookup instead of an RNA lookup
+        self._existing_names = None
+        if duplicate_mode == "OVERWRITE":
+            self._existing_names = {
+                attr: set(getattr(bpy.data, attr).keys())
+                for attr in _IMPORT_COLLECTIONS
+                if hasattr(bpy.data, attr)
+            }
+
         wm.progress_begin(0, total_assets)
-        
-        imported_count = 0
-        skipped_count = 0
-        error_count = 0
+        self._next_progress_time = 0.0
+
+        # Warm the page cache for the next few files on a background thread
+        # while the main thread is busy inside libraries.load
+        self._prefetch_slots = threading.Semaphore(PREFETCH_AHEAD)
+        self._prefetch_stop = threading.Event()
+        self._prefetcher = threading.Thread(
+            target=_prefetch_worker,
+            args=(valid_assets, self._prefetch_slots, self._prefetch_stop),
+            daemon=True,
+        )
+        self._prefetcher.start()
 
+        return None
+
+    def _import_next(self, context):
+        """Import the next queued file; returns False once the queue is empty."""
+        i = self._next_index
+        total_assets = len(self._queue)
+        if i >= total_assets:
+            return False
+
+        self._next_index = i + 1
+        asset_path = self._queue[i]
+
+        self._prefetch_slots.release()
+        # Each update redraws the progress indicator: cap it at ~30 Hz, but
+        # always show the last file
+        now = time.monotonic()
+        if now >= self._next_progress_time or i == total_assets - 1:
+            context.window_manager.progress_update(i)
+            self._next_progress_time = now + PROGRESS_UPDATE_INTERVAL
         try:
-            for i, asset_path in enumerate(selected_assets):
-                wm.progress_update(i)
-                try:
-                    result = self._import_asset_file(asset_path, duplicate_mode)
-                    if result is None or result is False:
-                        skipped_count += 1
-                    else:
-                        imported_count += 1
-                except (RuntimeError, OSError, IOError, MemoryError) as e:
-                    error_count += 1
-                    print(f"  ✗ Fatal error importing '{asset_path.name}': {e}")
-                    continue
-            
-            print("\nImport Summary:")
-            print(f"  Successfully imported: {imported_count} files")
+            result = self._import_asset_file(asset_path, self._existing_names)
+            if result is None or result is False:
+                self._skipped_count += 1
+            else:
+                self._imported_count += 1
+        except (RuntimeError, OSError, IOError, MemoryError) as e:
+            self._error_count += 1
+            print(f"  ✗ Fatal error importing '{asset_path.name}': {e}")
+        return True
+
+    def _discard_imported(self):
+        """Remove every datablock this run imported, leaving the file as it was."""
+        imported_ids = self._imported_ids or []
+        self._imported_ids = None
+
+        # Skip IDs that are already gone (OVERWRITE replaces earlier imports,
+        # a file load frees them all)
+        alive = []
+        for datablock in imported_ids:
+            try:
+                datablock.name
+            except ReferenceError:
+                continue
+            alive.append(datablock)
+        if not alive:
+            return
+
+        try:
+            bpy.data.batch_remove(alive)
+            debug_print(f"Removed {len(alive)} datablock(s) imported before cancelling")
+        except (RuntimeError, ReferenceError) as e:
+            print(f"Warning: Could not remove datablocks imported before cancelling: {e}")
+
+    def _end_import(self, context):
+        """Stop the prefetcher, flush buffered log lines and close progress/timer."""
+        self._prefetch_stop.set()
+        self._prefetch_slots.release()
+        self._prefetcher.join()
+        self._flush_log()
+
+        wm = context.window_manager
+        wm.progress_end()
+        if self._timer is not None:
+            wm.event_timer_remove(self._timer)
+            self._timer = None
+
+    def _finish_bundle(self, context):
+        """Save the imported datablocks as the bundle and report the result."""
+        props = context.window_manager.qam_bundler_props
+        imported_count = self._imported_count
+        skipped_count = self._skipped_count
+        error_count = self._error_count
+        target_path = self._target_path
+
+        print("\nImport Summary:")
+        print(f"  Successfully imported: {imported_count} files")
+        if skipped_count > 0:
+            print(f"  Skipped (incompatible): {skipped_count} files")
+        if error_count > 0:
+            print(f"  Failed with errors: {error_count} files")
+
+        # Nothing to bundle: report before writing an empty file to disk
+        if imported_count == 0:
+            self._discard_imported()
             if skipped_count > 0:
-                print(f"  Skipped (incompatible): {skipped_count} files")
-            if error_count > 0:
-                print(f"  Failed with errors: {error_count} files")
-                
-        except (RuntimeError, OSError, MemoryError) as e:
-            wm.progress_end()
-            self.report({"ERROR"}, f"Failed to import assets: {e}")
-            import traceback
-            traceback.print_exc()
+                self.report(
+                    {"ERROR"},
+                    f"No assets could be imported - all {skipped_count} files are incompatible with this Blender version"
+                )
+            else:
+                self.report({"ERROR"}, f"No assets could be imported ({error_count} failed with errors)")
             return {"CANCELLED"}
-        finally:
-            wm.progress_end()
 
         try:
             print(f"Saving bundle to: {target_path}")
-            bpy.ops.wm.save_as_mainfile(filepath=str(target_path), copy=True)
+            # Explicit, so the user's global compression preference doesn't
+            # silently add a zlib pass over the whole bundle
+            bpy.ops.wm.save_as_mainfile(
+                filepath=str(target_path), copy=True, compress=props.compress_bundle
+            )
             print("Bundle saved successfully")
         except (RuntimeError, OSError) as e:
+            self._discard_imported()
             self.report({"ERROR"}, f"Failed to save bundle: {e}")
             return {"CANCELLED"}
 
+        # The imported datablocks stay in the file: one undo step for the run.
+        # undo_push needs a window, so background/scripted runs skip it
+        # rather than failing after the bundle is already saved
+        self._imported_ids = None
+        if bpy.ops.ed.undo_push.poll():
+            bpy.ops.ed.undo_push(message=self.bl_label)
+
         if props.copy_catalog:
-            self._copy_catalog_file(library_path, target_path, output_name)
+            self._copy_catalog_file(self._library_path, target_path, self._output_name)
 
-        if skipped_count > 0 and imported_count > 0:
+        if skipped_count > 0:
             self.report(
                 {"WARNING"}, 
                 f"Bundle saved: {target_path.name} ({imported_count} imported, {skipped_count} skipped due to version incompatibility)"
             )
             props.show_success_message = True
             props.success_message_time = time.time()
-        elif skipped_count > 0 and imported_count == 0:
-            self.report(
-                {"ERROR"},
-                f"No assets could be imported - all {skipped_count} files are incompatible with this Blender version"
-            )
-            return {"CANCELLED"}
         else:
             self.report({"INFO"}, f"Bundle saved: {target_path.name} ({imported_count} assets)")
             props.show_success_message = True
@@ -237,8 +675,6 @@ class QAM_OT_bundle_assets(Operator):
 
     def _execute_current_file_bundle(self, context, props):
         """Bundle selected assets from the Current File into a single .blend file."""
-        from .file_io import write_blend_file
-
         # Collect local datablocks from selected assets
         local_datablocks = set()
         asset_files = None
@@ -282,31 +718,25 @@ class QAM_OT_bundle_assets(Operator):
             self.report({"ERROR"}, f"Failed to save bundle to {target_path.name}")
             return {"CANCELLED"}
 
-    def _calculate_total_size(self, asset_paths):
-        """Calculate the total size of all asset files in megabytes."""
-        total_bytes = 0
-        for asset_path in asset_paths:
-            try:
-                if asset_path.exists():
-                    total_bytes += asset_path.stat().st_size
-            except (OSError, PermissionError) as e:
-                print(f"Could not get size of {asset_path.name}: {e}")
-            except Exception as e:
-                print(f"Unexpected error getting size of {asset_path.name}: {e}")
-
-        return total_bytes / (1024 * 1024)
-
-    def _collect_selected_assets(self, context):
-        """Collect absolute paths of selected asset files."""
-        selected_assets = []
-        asset_blend_files = set()
-
-        active_library = self._get_active_library(context)
-        if not active_library:
-            debug_print("Could not get active library")
-            return selected_assets
-
-        library_path = Path(active_library.path)
+    def _collect_selected_assets(self, context, library_path):
+        """Collect absolute paths of selected asset files in the library.
+
+        Args:
+            context: Blender context with the asset selection
+            library_path (str): Root folder of the active asset library
+
+        Returns:
+            list: (Path, os.stat_result) for each distinct selected path that
+                  exists; validation is left to _validate_asset_file()
+        """
+        accepted = []
+        # Normalised path strings: cheap to hash, and case-insensitive on
+        # Windows so C:/lib/a.blend and c:/lib/a.blend count once
+        seen_keys = set()
+        candidates = []
+
+        # Paths stay plain strings until a file is accepted: os.path calls are
+        # much cheaper per asset than Path arithmetic on large selections
         debug_print(f"Library path: {library_path}")
 
         asset_files = None
@@ -326,69 +756,82 @@ class QAM_OT_bundle_assets(Operator):
 
         if not asset_files:
             debug_print("No asset files found")
-            return selected_assets
+            return accepted
+
+        # Every selected item has the same RNA type, so probe which path
+        # attributes it offers once instead of hasattr() per item
+        first_file = asset_files[0]
+        has_full_library_path = hasattr(first_file, "full_library_path")
+        has_full_path = hasattr(first_file, "full_path")
+        has_relative_path = hasattr(first_file, "relative_path")
+        has_name = hasattr(first_file, "name")
 
         for asset_file in asset_files:
             asset_path = None
 
-            if hasattr(asset_file, "full_library_path"):
+            if has_full_library_path:
                 full_path = asset_file.full_library_path
                 if full_path:
-                    asset_path = Path(full_path)
+                    asset_path = full_path
                     debug_print(f"Using full_library_path: {asset_path}")
 
-            if not asset_path and hasattr(asset_file, "full_path"):
+            if not asset_path and has_full_path:
                 full_path = asset_file.full_path
                 if full_path:
-                    asset_path = Path(full_path)
+                    asset_path = full_path
                     debug_print(f"Using full_path: {asset_path}")
 
-            if not asset_path and hasattr(asset_file, "relative_path"):
-                asset_path = library_path / asset_file.relative_path
+            if not asset_path and has_relative_path:
+                asset_path = os.path.join(library_path, asset_file.relative_path)
                 debug_print(f"Using relative_path: {asset_file.relative_path}")
 
-            if not asset_path and hasattr(asset_file, "name"):
+            if not asset_path and has_name:
                 file_name = asset_file.name
                 debug_print(f"Fallback: trying name-based path for: {file_name}")
 
                 if not file_name.endswith(".blend"):
-                    asset_path = library_path / f"{file_name}.blend"
+                    asset_path = os.path.join(library_path, f"{file_name}.blend")
                 else:
-                    asset_path = library_path / file_name
+                    asset_path = os.path.join(library_path, file_name)
 
             if asset_path:
-                debug_print(f"Checking path: {asset_path}")
-
-                if asset_path.exists():
-                    if asset_path.is_file() and asset_path.suffix.lower() == ".blend":
-                        try:
-                            file_size = asset_path.stat().st_size
-                            if file_size > MIN_BLEND_FILE_SIZE:
-                                asset_blend_files.add(asset_path)
-                                debug_print(f"✓ Added asset: {asset_path.name} ({file_size} bytes)")
-                            else:
-                                print(f"⚠ Skipping {asset_path.name}: File too small ({file_size} bytes, minimum {MIN_BLEND_FILE_SIZE})")
-                        except OSError as e:
-                            print(f"⚠ Cannot access {asset_path.name}: {e}")
-                    elif asset_path.is_dir():
-                        debug_print(f"✗ Is a directory, not a file: {asset_path}")
-                    else:
-                        debug_print(f"✗ Not a .blend file: {asset_path.suffix}")
-                else:
-                    debug_print(f"✗ Path does not exist: {asset_path}")
-                    if asset_path.parent.exists():
-                        debug_print(f"   Parent directory exists: {asset_path.parent}")
-                        try:
-                            actual_files = list(asset_path.parent.glob("*.blend"))
-                            if actual_files:
-                                debug_print(f"   Found {len(actual_files)} .blend files in parent directory")
-                        except OSError:
-                            pass
-
-        selected_assets = list(asset_blend_files)
-        debug_print(f"Total unique .blend files found: {len(selected_assets)}")
+                # Multi-asset files show up once per selected asset: only
+                # check each file the first time it appears
+                key = os.path.normcase(os.path.normpath(asset_path))
+                if key in seen_keys:
+                    continue
+                seen_keys.add(key)
+                candidates.append(asset_path)
+
+        if not candidates:
+            return accepted
+
+        # Path resolution above is CPU-only; the stat() calls are what block
+        # on slow or network libraries, so overlap them across threads
+        workers = min(STAT_MAX_WORKERS, len(candidates))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            stats = list(executor.map(_stat_once, candidates))
+
+        for asset_path, st in zip(candidates, stats):
+            debug_print(f"Checking path: {asset_path}")
+
+            # The stat result travels with the path, so validation needs no
+            # further syscalls
+            if st is not None:
+                accepted.append((Path(asset_path), st))
+            else:
+                debug_print(f"✗ Path does not exist: {asset_path}")
+                if not DEBUG_MODE:
+                    continue
+                # Diagnostics only: one scandir per folder, no stat per entry
+                parent = os.path.dirname(asset_path)
+                if os.path.isdir(parent):
+                    debug_print(f"   Parent directory exists: {parent}")
+                    actual_files = _list_blends(parent)
+                    if actual_files:
+                        debug_print(f"   Found {len(actual_files)} .blend files in parent directory")
 
-        return selected_assets
+        return accepted
 
     def _get_active_library(self, context):
         """Get the active asset library object."""
@@ -424,77 +867,71 @@ class QAM_OT_bundle_assets(Operator):
             debug_print("No asset library reference found")
             return None
 
-        for lib in prefs.filepaths.asset_libraries:
-            if hasattr(lib, "name") and lib.name == asset_lib_ref:
-                debug_print(f"Found library: {lib.name} at {lib.path}")
-                return lib
+        libs_by_name = {
+            lib.name: lib for lib in prefs.filepaths.asset_libraries if hasattr(lib, "name")
+        }
+        lib = libs_by_name.get(asset_lib_ref)
+        if lib is None:
+            debug_print(f"No matching library found for: {asset_lib_ref}")
+            return None
 
-        debug_print(f"No matching library found for: {asset_lib_ref}")
-        return None
+        debug_print(f"Found library: {lib.name} at {lib.path}")
+        return lib
 
-    def _validate_asset_file(self, asset_path):
-        """Validate that an asset file is suitable for import."""
-        if not asset_path.exists():
-            return False, f"File does not exist: {asset_path}"
-        
-        if not asset_path.is_file():
+    def _validate_asset_file(self, asset_path, st):
+        """Validate that an asset file is suitable for import.
+
+        Args:
+            asset_path (Path): The asset file
+            st (os.stat_result): Its stat result from _collect_selected_assets
+        """
+        if not stat.S_ISREG(st.st_mode):
             return False, f"Not a file: {asset_path}"
         
-        if asset_path.suffix.lower() != ".blend":
+        if not asset_path.name.lower().endswith(".blend"):
             return False, f"Not a .blend file: {asset_path}"
         
-        try:
-            file_size = asset_path.stat().st_size
-            if file_size < MIN_BLEND_FILE_SIZE:
-                return False, f"File too small ({file_size} bytes), possibly corrupted (minimum {MIN_BLEND_FILE_SIZE} bytes)"
-        except OSError as e:
-            return False, f"Cannot access file: {e}"
+        # The one minimum-size rule: a file must be larger than the minimum
+        if st.st_size <= MIN_BLEND_FILE_SIZE:
+            return False, f"File too small ({st.st_size} bytes), possibly corrupted (minimum {MIN_BLEND_FILE_SIZE} bytes)"
         
         return True, None
 
-    def _import_asset_file(self, asset_path, duplicate_mode):
-        """Import datablocks from a .blend file, preserving asset status."""
-        print(f"  Importing: {asset_path.name}")
-        
-        is_valid, error_msg = self._validate_asset_file(asset_path)
-        if not is_valid:
-            print(f"  ✗ Skipping: {error_msg}")
-            return False
+    def _import_asset_file(self, asset_path, existing_names=None):
+        """Import datablocks from a .blend file, preserving asset status.
 
-        skip_collections = {
-            "workspaces",
-            "screens",
-            "window_managers",
-            "scenes",
-            "version",
-            "filepath",
-            "is_dirty",
-            "is_saved",
-            "use_autopack",
-        }
+        Args:
+            asset_path: Path of the .blend file to import
+            existing_names: OVERWRITE mode only - {collection: set of names}
+                already in bpy.data; matching datablocks are removed before
+                import and the set is kept up to date for later files
+        """
+        self._log(f"  Importing: {asset_path.name}")
 
         try:
+            requested = []
             with bpy.data.libraries.load(str(asset_path), link=False) as (
                 data_from,
                 data_to,
             ):
-                for attr in dir(data_from):
-                    if attr.startswith("_") or attr in skip_collections:
-                        continue
-
+                for attr in _IMPORT_COLLECTIONS:
                     try:
                         source_collection = getattr(data_from, attr, None)
                         if source_collection and len(source_collection) > 0:
-                            items_to_import = []
-
-                            for item_name in source_collection:
-                                if duplicate_mode == "OVERWRITE":
-                                    self._remove_existing_datablock(attr, item_name)
+                            items_to_import = list(source_collection)
 
-                                items_to_import.append(item_name)
+                            if existing_names is not None:
+                                existing = existing_names.setdefault(attr, set())
+                                for item_name in items_to_import:
+                                    if item_name in existing:
+                                        self._remove_existing_datablock(attr, item_name)
+                                # Imported under these names: a later file
+                                # with the same names overwrites them again
+                                existing.update(items_to_import)
 
                             if items_to_import:
                                 setattr(data_to, attr, items_to_import)
+                                requested.append(attr)
                     except (AttributeError, TypeError, KeyError, RuntimeError) as e:
                         debug_print(f"Skipping collection '{attr}': {e}")
                     except (ValueError, MemoryError) as e:
@@ -502,16 +939,37 @@ class QAM_OT_bundle_assets(Operator):
         except (OSError, IOError, RuntimeError) as e:
             error_msg = str(e)
             if "not a blend file" in error_msg.lower() or "failed to read blend file" in error_msg.lower():
-                print(f"  ⚠ Skipping '{asset_path.name}': Incompatible blend file version")
-                print("     (This file may have been created in a newer version of Blender)")
+                self._log(f"  ⚠ Skipping '{asset_path.name}': Incompatible blend file version")
+                self._log("     (This file may have been created in a newer version of Blender)")
                 return False
             else:
                 print(f"  ✗ Error loading blend file '{asset_path.name}': {e}")
                 print(f"     Full path: {asset_path}")
                 raise
+
+        # After the load, data_to holds the new IDs (None where one failed)
+        if self._imported_ids is not None:
+            for attr in requested:
+                self._imported_ids.extend(
+                    datablock for datablock in getattr(data_to, attr) if datablock is not None
+                )
         
         return True
 
+    def _log(self, message):
+        """Queue a progress line for _flush_log(), or print it if no run is buffering."""
+        if self._log_buf is None:
+            print(message)
+        else:
+            self._log_buf.append(message)
+
+    def _flush_log(self):
+        """Write all queued progress lines to stdout with a single write."""
+        if self._log_buf:
+            sys.stdout.write("\n".join(self._log_buf) + "\n")
+            sys.stdout.flush()
+        self._log_buf = None
+
     def _remove_existing_datablock(self, collection_name, item_name):
         """Remove an existing datablock if OVERWRITE mode is active."""
         try:
@@ -535,12 +993,19 @@ class QAM_OT_bundle_assets(Operator):
         )
 
         try:
-            shutil.copy(catalog_source, catalog_dest)
+            # copyfile: contents only (no chmod), kernel zero-copy where available
+            shutil.copyfile(str(catalog_source), str(catalog_dest))
             print(f"Catalog file copied to {catalog_dest}")
         except (OSError, IOError, shutil.Error) as e:
             print(f"Warning: Could not copy catalog file: {e}")
 
 
+def clear_path_check_cache():
+    """Forget cached bundle-inside-library checks (call when save_path changes)."""
+    QAM_OT_bundle_assets._path_check_cache.clear()
+    _resolved.cache_clear()
+
+
 class QAM_OT_open_bundle_folder(Operator):
     """Open the folder where bundles are saved."""
 
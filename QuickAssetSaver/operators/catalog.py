@@ -2,15 +2,32 @@
 Catalog parsing and management functions for Quick Asset Saver.
 """
 
+import re
 import uuid
 from pathlib import Path
 
 import bpy
 
-from .utils import debug_print
+from .utils import debug_print, DEBUG_MODE
 
 _CATALOG_ENUM_CACHE = []
 
+# Parsed CDFs keyed by file path, reused while the file is unchanged:
+# str(cdf_path) -> (mtime_ns, size, catalogs, enum_items, uuid_to_path)
+_CDF_CACHE = {}
+
+# One CDF entry per line: "<uuid>:<catalog/path>[:<simple name>]". The UUID
+# shape is validated by the pattern itself; comments, VERSION and malformed
+# lines simply don't match.
+_CDF_LINE_RE = re.compile(
+    r"(?m)^[ \t]*"
+    r"([0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})"
+    r"[ \t]*:[ \t]*([^:\r\n]*[^:\s])"
+)
+
+# Tags may be separated by commas or newlines (pasted lists)
+_TAG_SEPARATOR_RE = re.compile(r"[,\n]")
+
 
 def get_catalog_path_from_uuid(library_path, catalog_uuid):
     """
@@ -26,105 +43,104 @@ def get_catalog_path_from_uuid(library_path, catalog_uuid):
     if not catalog_uuid or catalog_uuid == "UNASSIGNED":
         return None
 
+    _, _, uuid_to_path = _read_cdf(library_path)
+
+    # Keys only ever hold well-formed UUIDs, so a hit needs no validation
+    catalog_path = uuid_to_path.get(catalog_uuid)
+    if catalog_path is not None:
+        return catalog_path
+
     try:
         uuid.UUID(catalog_uuid)
     except (ValueError, AttributeError, TypeError):
         print(f"Invalid UUID format: {catalog_uuid}")
-        return None
-
-    catalogs, _ = get_catalogs_from_cdf(library_path)
-
-    for path, uuid_str in catalogs.items():
-        if uuid_str == catalog_uuid:
-            return path
 
     return None
 
 
-def get_catalogs_from_cdf(library_path):
+def _read_cdf(library_path):
     """
-    Parse the blender_assets.cats.txt Catalog Definition File (CDF).
+    Parse a library's CDF, reusing the cached result while it is unchanged.
 
-    Args:
-        library_path (str): Path to the asset library folder
+    The cache is keyed per file on (mtime_ns, size), so switching between
+    libraries doesn't force a re-parse and an edited file is always re-read.
 
     Returns:
-        dict: Mapping of catalog paths to UUIDs, e.g., {"Materials/Metal": "uuid-string"}
-        list: List of tuples for EnumProperty items: (identifier, name, description)
-        
-    Note:
-        Items are cached in _CATALOG_ENUM_CACHE to prevent garbage collection
-        before Blender can display them (known Blender API issue).
+        tuple: (catalogs dict, enum_items list, {uuid: path} dict)
     """
-    global _CATALOG_ENUM_CACHE
-    
-    library_path = Path(library_path)
-    cdf_path = library_path / "blender_assets.cats.txt"
+    cdf_path = Path(library_path) / "blender_assets.cats.txt"
+    cache_key = str(cdf_path)
 
     catalogs = {}
     enum_items = [("UNASSIGNED", "Unassigned", "No catalog assigned", "NONE", 0)]
 
-    if not cdf_path.exists():
+    try:
+        st = cdf_path.stat()
+    except OSError:
         debug_print(f"No catalog file found at {cdf_path}")
-        _CATALOG_ENUM_CACHE = enum_items
-        return catalogs, _CATALOG_ENUM_CACHE
+        _CDF_CACHE.pop(cache_key, None)
+        return catalogs, enum_items, {}
+
+    cached = _CDF_CACHE.get(cache_key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2], cached[3], cached[4]
 
     try:
-        with open(cdf_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-
-        idx = 1
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
-            if not line or line.startswith("#") or line.startswith("VERSION"):
-                continue
-
-            parts = line.split(":")
-            if len(parts) >= 2:
-                catalog_uuid = parts[0].strip()
-                catalog_path = parts[1].strip()
-
-                if not catalog_path:
-                    print(f"Line {line_num}: Empty catalog path, skipping")
-                    continue
-
-                try:
-                    uuid.UUID(catalog_uuid)
-                    catalogs[catalog_path] = catalog_uuid
-                    
-                    # Ensure catalog path (which may contain Unicode characters) is properly handled
-                    # This supports Chinese, Japanese, Korean and other non-ASCII catalog names
-                    display_name = str(catalog_path)
-                    
-                    debug_print(f"[QAM Catalog Debug] Adding catalog {idx}: uuid={catalog_uuid}, name={display_name}")
-                    
-                    enum_items.append(
-                        (
-                            catalog_uuid,
-                            display_name,
-                            f"Catalog: {display_name}",
-                            "ASSET_MANAGER",
-                            idx,
-                        )
-                    )
-                    idx += 1
-                except ValueError:
-                    print(f"Line {line_num}: Invalid UUID format: {catalog_uuid}")
-                    continue
-            else:
-                print(
-                    f"Line {line_num}: Malformed catalog entry (expected at least 2 colon-separated fields)"
-                )
+        # Read the whole file in one call
+        text = cdf_path.read_text(encoding="utf-8")
+
+        # The regex engine does the line filtering, splitting and UUID shape
+        # check in one pass; catalog paths may contain any non-ASCII text
+        entries = _CDF_LINE_RE.findall(text)
+
+        # Build both structures in bulk rather than growing them per line
+        catalogs = {catalog_path: catalog_uuid for catalog_uuid, catalog_path in entries}
+        enum_items.extend(
+            (catalog_uuid, catalog_path, f"Catalog: {catalog_path}", "ASSET_MANAGER", idx)
+            for idx, (catalog_uuid, catalog_path) in enumerate(entries, 1)
+        )
+
+        if DEBUG_MODE:
+            for idx, (catalog_uuid, catalog_path) in enumerate(entries, 1):
+                print(f"[QAM Catalog Debug] Adding catalog {idx}: uuid={catalog_uuid}, name={catalog_path}")
 
     except (OSError, IOError) as e:
         print(f"Error reading catalog file {cdf_path}: {e}")
+        return catalogs, enum_items, {}
     except UnicodeDecodeError as e:
         print(f"Encoding error reading catalog file {cdf_path}: {e}")
+        return catalogs, enum_items, {}
+
+    uuid_to_path = {uuid_str: path for path, uuid_str in catalogs.items()}
+    _CDF_CACHE[cache_key] = (st.st_mtime_ns, st.st_size, catalogs, enum_items, uuid_to_path)
+    debug_print(f"[QAM Catalog Debug] Cached {len(enum_items)} catalog items")
+
+    return catalogs, enum_items, uuid_to_path
+
+
+def get_catalogs_from_cdf(library_path):
+    """
+    Parse the blender_assets.cats.txt Catalog Definition File (CDF).
+
+    Args:
+        library_path (str): Path to the asset library folder
 
+    Returns:
+        dict: Mapping of catalog paths to UUIDs, e.g., {"Materials/Metal": "uuid-string"}
+        list: List of tuples for EnumProperty items: (identifier, name, description)
+        
+    Note:
+        Items are cached in _CATALOG_ENUM_CACHE to prevent garbage collection
+        before Blender can display them (known Blender API issue). Unchanged
+        files are served from _CDF_CACHE without re-reading them.
+    """
+    global _CATALOG_ENUM_CACHE
+
+    catalogs, enum_items, _ = _read_cdf(library_path)
     _CATALOG_ENUM_CACHE = enum_items
-    debug_print(f"[QAM Catalog Debug] Cached {len(_CATALOG_ENUM_CACHE)} catalog items")
-    
-    return catalogs, _CATALOG_ENUM_CACHE
+
+    # Copy so callers can't mutate the cached parse
+    return dict(catalogs), _CATALOG_ENUM_CACHE
 
 
 def clear_and_set_tags(asset_data, tags_string):
@@ -132,16 +148,20 @@ def clear_and_set_tags(asset_data, tags_string):
     Clear existing tags and set new ones from a comma-separated string.
 
     Replaces all existing tags on an asset with a new set parsed from
-    the input string. Empty or whitespace-only tags are ignored.
+    the input string. Empty or whitespace-only tags are ignored, and
+    duplicates are added only once (first occurrence wins).
 
     Args:
         asset_data: Blender asset_data object with tags collection
-        tags_string (str): Comma-separated string of tags (e.g., "metal, shiny, PBR")
+        tags_string (str): Comma- or newline-separated string of tags
+                           (e.g., "metal, shiny, PBR")
 
     Note:
         This is a helper to avoid duplicating tag management logic.
-        Tags collection doesn't have a clear() method, so we remove in reverse
-        to avoid index shifting issues during iteration.
+        Uses tags.clear() where the API provides it; otherwise the tags are
+        snapshotted once and removed in reverse to avoid index shifting. Tag names are string
+        properties, which foreach_set() does not support, so tags are still
+        added one by one - but only after parsing and de-duplicating in Python.
         
     Example:
         >>> clear_and_set_tags(material.asset_data, "metal, shiny, chrome")
@@ -150,19 +170,27 @@ def clear_and_set_tags(asset_data, tags_string):
     if not hasattr(asset_data, "tags"):
         return
 
-    while len(asset_data.tags) > 0:
-        asset_data.tags.remove(asset_data.tags[-1])
+    tags = asset_data.tags
+    clear = getattr(tags, "clear", None)
+    if clear is not None:
+        clear()
+    else:
+        # Snapshot once (last to first) instead of len() + index per removal
+        for tag in reversed(list(tags)):
+            tags.remove(tag)
 
     if tags_string:
-        tags_list = [t.strip() for t in tags_string.split(",") if t.strip()]
-        for tag in tags_list:
-            asset_data.tags.new(tag)
+        # dict.fromkeys() de-duplicates while keeping the user's order
+        stripped = (t.strip() for t in _TAG_SEPARATOR_RE.split(tags_string))
+        for tag in dict.fromkeys(filter(None, stripped)):
+            tags.new(tag)
 
 
 def clear_catalog_cache():
-    """Clear the catalog enum cache to force re-reading from disk."""
+    """Clear the catalog caches to force re-reading from disk."""
     global _CATALOG_ENUM_CACHE
     _CATALOG_ENUM_CACHE = []
+    _CDF_CACHE.clear()
 
 
 def create_catalog_entry(library_path: str, catalog_path: str) -> str:
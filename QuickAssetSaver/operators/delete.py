@@ -3,7 +3,10 @@ Delete operator for Quick Asset Saver.
 Handles deleting assets from the Asset Browser.
 """
 
-import shutil
+import os
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 import bpy
 from bpy.types import Operator
@@ -11,33 +14,86 @@ from bpy.types import Operator
 try:
     from send2trash import send2trash as _send2trash
 
+    _HAS_SEND2TRASH = True
+
     def move_to_trash(path) -> None:
         _send2trash(str(path))
 
+    def move_many_to_trash(paths) -> None:
+        # One call for the whole list: a single shell operation on Windows/macOS
+        _send2trash([str(p) for p in paths])
+
 except ImportError:
+    _HAS_SEND2TRASH = False
+
     def move_to_trash(path) -> None:
-        from pathlib import Path
         p = Path(path)
         raise RuntimeError(
             f"Send2Trash is unavailable. '{p.name}' was NOT deleted.\n"
             f"You can delete it manually at: {p.parent}"
         )
 
+    def move_many_to_trash(paths) -> None:
+        raise RuntimeError(
+            f"Send2Trash is unavailable. {len(paths)} item(s) were NOT deleted."
+        )
+
 from .utils import (
     debug_print,
     refresh_asset_browser,
+    scan_companion_folder,
+    collect_companions_for_file,
     ALL_DATABLOCK_COLLECTIONS,
 )
 from .file_io import (
     collect_selected_assets_with_names,
     count_assets_in_blend,
+    count_assets_in_blends,
 )
-from ..constants import (
-    COMPANION_FOLDER_GROUPS,
-    THUMBNAIL_EXTENSIONS,
-    METADATA_EXTENSIONS,
+
+# Trashing is syscall/shell-latency bound (especially on network drives),
+# so overlapping the calls scales close to linearly with worker count.
+TRASH_MAX_WORKERS = 16
+
+# OS-generated files that don't stop an otherwise empty folder being cleaned up
+_SYSTEM_FILES = frozenset({'desktop.ini', 'Thumbs.db', '.DS_Store'})
+
+
+# Datablock types _remove_datablock cleans up, and the bpy.data collection
+# each is removed from
+_REMOVABLE_TYPES = (
+    ("Object", "objects"),
+    ("Material", "materials"),
+    ("NodeTree", "node_groups"),
+    ("World", "worlds"),
+    ("Collection", "collections"),
+    ("Mesh", "meshes"),
+    ("Curve", "curves"),
+    ("Armature", "armatures"),
+    ("Action", "actions"),
+    ("Brush", "brushes"),
 )
 
+# Exact RNA type -> collection name (None: not removed), filled on demand
+_REMOVAL_COLLECTIONS = {}
+
+
+def _removal_collection_for(datablock_type):
+    """bpy.data collection name for a datablock type, resolved once per type."""
+    try:
+        return _REMOVAL_COLLECTIONS[datablock_type]
+    except KeyError:
+        pass
+
+    # Subtypes (ShaderNodeTree, TextCurve, ...) map through their base type
+    collection_name = None
+    for type_name, name in _REMOVABLE_TYPES:
+        if issubclass(datablock_type, getattr(bpy.types, type_name)):
+            collection_name = name
+            break
+    _REMOVAL_COLLECTIONS[datablock_type] = collection_name
+    return collection_name
+
 
 def _should_cleanup_empty_folder(folder_path):
     """Check if a folder is empty or only contains hidden/system files.
@@ -47,100 +103,73 @@ def _should_cleanup_empty_folder(folder_path):
     CRITICAL: NEVER returns True for folders containing blender_assets.cats.txt
     or any library root folder. This protects catalog definitions.
     """
-    from pathlib import Path
-    folder_path = Path(folder_path)
-    
-    if not folder_path.exists() or not folder_path.is_dir():
-        return False
-    
+    # One streamed listing, stopping at the first entry that keeps the
+    # folder; a missing folder or a non-directory fails the scandir itself
     try:
-        # NEVER cleanup folders containing catalog files - these are library roots!
-        catalog_file = folder_path / "blender_assets.cats.txt"
-        if catalog_file.exists():
-            debug_print(f"PROTECTED: {folder_path} contains catalog file, will not cleanup")
-            return False
-        
-        # Get all contents
-        contents = list(folder_path.iterdir())
-        
-        # Empty folder - should be cleaned up
-        if not contents:
-            return True
-        
-        # Check if only contains hidden/system files
-        for item in contents:
-            name = item.name
-            # Skip hidden files and common system files
-            if name.startswith('.') or name.startswith('~') or name in ['desktop.ini', 'Thumbs.db', '.DS_Store']:
-                continue
-            # Found a real file/folder - don't cleanup
-            return False
-        
-        # Only hidden/system files found - cleanup
-        return True
-        
-    except Exception:
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                name = entry.name
+                # NEVER cleanup folders containing catalog files - these are library roots!
+                if name == "blender_assets.cats.txt":
+                    debug_print(f"PROTECTED: {folder_path} contains catalog file, will not cleanup")
+                    return False
+                # Skip hidden files and common system files
+                if name.startswith(('.', '~')) or name in _SYSTEM_FILES:
+                    continue
+                # Found a real file/folder - don't cleanup
+                return False
+    except OSError:
         return False
 
+    # Empty, or only hidden/system files found - cleanup
+    return True
+
+
+def _safe_trash(path):
+    """Send a path to the trash without raising.
 
-def _trash_companions_for_file(blend_path):
-    """Send companion files for a .blend file to recycle bin.
-    
-    Trashes:
-    - Thumbnails: {stem}.png, thumbnail.webp, etc.
-    - Common asset folders: textures/, maps/, materials/, etc.
-    - Asset-named subfolders: {stem}/
-    - Metadata files: *.json, *.txt, *.md, *.xml
-    
     Returns:
-        int: Number of companion items trashed
+        tuple: (True, None) on success, (False, exception) on failure
     """
-    from pathlib import Path
-    blend_path = Path(blend_path)
-    items_to_trash = []
-    
-    stem = blend_path.stem
-    parent = blend_path.parent
-    
-    # Collect thumbnails - both stem-named and generic "thumbnail" named
-    for ext in THUMBNAIL_EXTENSIONS:
-        thumbnail_path = parent / f"{stem}{ext}"
-        if thumbnail_path.exists():
-            items_to_trash.append(thumbnail_path)
-        thumbnail_path = parent / f"thumbnail{ext}"
-        if thumbnail_path.exists():
-            items_to_trash.append(thumbnail_path)
-    
-    # Collect common asset companion folders
-    for folder_group in COMPANION_FOLDER_GROUPS:
-        for folder_name in folder_group:
-            folder_path = parent / folder_name
-            if folder_path.exists() and folder_path.is_dir():
-                items_to_trash.append(folder_path)
-                break  # Only trash one folder per group
-    
-    # Collect asset-named subfolder
-    asset_folder = parent / stem
-    if asset_folder.exists() and asset_folder.is_dir():
-        items_to_trash.append(asset_folder)
-    
-    # Collect metadata files - but NEVER touch catalog files!
-    protected_files = {'blender_assets.cats.txt'}
-    for ext in METADATA_EXTENSIONS:
-        for f in parent.glob(f"*{ext}"):
-            if f.is_file() and f not in items_to_trash and f.name not in protected_files:
-                items_to_trash.append(f)
-    
-    trashed_count = 0
-    for item in items_to_trash:
-        try:
-            move_to_trash(str(item))
-            debug_print(f"Sent companion to recycle bin: {item}")
-            trashed_count += 1
-        except (RuntimeError, Exception) as e:
-            debug_print(f"Warning: Could not trash {item}: {e}")
-    
-    return trashed_count
+    try:
+        move_to_trash(str(path))
+        return True, None
+    except (OSError, RuntimeError) as e:
+        # Send2Trash reports failures as OSError (TrashPermissionError is a
+        # PermissionError); RuntimeError comes from the no-Send2Trash fallback
+        return False, e
+
+
+def _trash_batch(paths):
+    """Send many paths to the trash with one batched call.
+
+    If the batch fails, each path that still exists is retried on its own
+    so failures can be reported per item (a failed batch may already have
+    trashed part of the list).
+
+    Returns:
+        list: (success, error) tuples in the same order as paths
+    """
+    if not paths:
+        return []
+
+    try:
+        move_many_to_trash(paths)
+        return [(True, None)] * len(paths)
+    except (OSError, RuntimeError) as e:
+        if not _HAS_SEND2TRASH:
+            # Nothing can be trashed: retrying each path would fail the same way
+            return [(False, e)] * len(paths)
+        debug_print(f"Batched trash failed, retrying items one by one: {e}")
+
+    def retry(path):
+        if not os.path.lexists(path):
+            return True, None
+        return _safe_trash(path)
+
+    workers = min(TRASH_MAX_WORKERS, len(paths))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(retry, paths))
 
 
 class QAM_OT_delete_selected_assets(Operator):
@@ -153,6 +182,8 @@ class QAM_OT_delete_selected_assets(Operator):
     
     _single_asset_files: list = []
     _multi_asset_entries: list = []
+    # count_assets_in_blend results from invoke(), reused by execute()
+    _files_analyzed: dict = {}
 
     def invoke(self, context, event):
         self._single_asset_files = []
@@ -163,17 +194,16 @@ class QAM_OT_delete_selected_assets(Operator):
             self.report({"WARNING"}, "No assets selected")
             return {"CANCELLED"}
         
-        files_analyzed = {}
+        files_analyzed = count_assets_in_blends(asset['path'] for asset in selected_assets)
         for asset in selected_assets:
             path = asset['path']
-            if path not in files_analyzed:
-                files_analyzed[path] = count_assets_in_blend(path)
-            
             asset_count = files_analyzed[path]['count']
             if asset_count <= 1:
                 self._single_asset_files.append(path)
             else:
                 self._multi_asset_entries.append((path, asset['name'], asset_count))
+
+        self._files_analyzed = files_analyzed
         
         return context.window_manager.invoke_props_dialog(self, width=480)
 
@@ -230,43 +260,36 @@ class QAM_OT_delete_selected_assets(Operator):
         folders_cleaned = 0
         companions_trashed = 0
         
-        files_to_process = {}
+        # Group the selected names by file first, then count each file once
+        selected_by_file = {}
         for asset in selected_assets:
-            path = asset['path']
-            if path not in files_to_process:
-                files_to_process[path] = {
-                    'asset_info': count_assets_in_blend(path),
-                    'selected_assets': []
-                }
-            files_to_process[path]['selected_assets'].append(asset['name'])
+            selected_by_file.setdefault(asset['path'], []).append(asset['name'])
+
+        files_to_process = {
+            path: {
+                'asset_info': self._files_analyzed.get(path) or count_assets_in_blend(path),
+                'selected_assets': names,
+            }
+            for path, names in selected_by_file.items()
+        }
         
-        for path, info in files_to_process.items():
+        # Work folder by folder rather than in selection order, so rewrites
+        # and their .tmp_ copies stay together on disk
+        single_asset_files = []
+        for path, info in sorted(
+            files_to_process.items(), key=lambda item: (str(item[0].parent), item[0].name)
+        ):
             total_assets = info['asset_info']['count']
             selected_names = info['selected_assets']
             
             if total_assets <= 1:
-                try:
-                    parent_folder = path.parent
-                    
-                    # Trash companion files first
-                    companions_count = _trash_companions_for_file(path)
-                    companions_trashed += companions_count
-                    
-                    # Then trash the .blend file itself
-                    move_to_trash(str(path))
-                    deleted_files += 1
-                    
-                    # Check if parent folder is now empty and clean it up
-                    if _should_cleanup_empty_folder(parent_folder):
-                        try:
-                            move_to_trash(str(parent_folder))
-                            folders_cleaned += 1
-                            debug_print(f"Cleaned up empty folder: {parent_folder}")
-                        except (RuntimeError, Exception) as e:
-                            debug_print(f"Could not cleanup empty folder {parent_folder}: {e}")
-                except (RuntimeError, Exception) as e:
-                    print(f"Failed to send {path.name} to trash: {e}")
+                # Already gone (deleted by another tool since selection):
+                # skip the companion scan and the trash calls that would fail
+                if not os.path.isfile(path):
+                    print(f"Failed to send {path.name} to trash: file no longer exists")
                     failed += 1
+                    continue
+                single_asset_files.append(path)
             else:
                 try:
                     success = self._remove_assets_from_blend(path, selected_names)
@@ -278,6 +301,67 @@ class QAM_OT_delete_selected_assets(Operator):
                     print(f"Failed to modify {path.name}: {e}")
                     failed += len(selected_names)
 
+        if single_asset_files and not _HAS_SEND2TRASH:
+            # Files are never deleted permanently: without Send2Trash none of
+            # them can go, so don't scan companions or try each file in turn
+            print(
+                f"Send2Trash is unavailable. {len(single_asset_files)} file(s) were NOT deleted."
+            )
+            failed += len(single_asset_files)
+        elif single_asset_files:
+            # List each parent folder once, however many files it holds;
+            # the scans are I/O bound, so run them on the pool
+            folders = list(dict.fromkeys(str(path.parent) for path in single_asset_files))
+            workers = min(TRASH_MAX_WORKERS, len(folders))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                listings = dict(zip(folders, executor.map(scan_companion_folder, folders)))
+
+            # Files in one folder share companions (metadata, textures/...),
+            # so de-duplicate to put each item in the batch once
+            companions = list(dict.fromkeys(
+                item
+                for path in single_asset_files
+                for item in collect_companions_for_file(path, listings[str(path.parent)] or [])
+            ))
+
+            # Companions first, then the .blend files, in one trash batch
+            results = _trash_batch(companions + [str(path) for path in single_asset_files])
+            companion_results = results[:len(companions)]
+            blend_results = results[len(companions):]
+
+            for item, (success, error) in zip(companions, companion_results):
+                if success:
+                    companions_trashed += 1
+                else:
+                    debug_print(f"Warning: Could not trash {item}: {error}")
+
+            parent_folders = []
+            for path, (success, error) in zip(single_asset_files, blend_results):
+                if success:
+                    deleted_files += 1
+                    if path.parent not in parent_folders:
+                        parent_folders.append(path.parent)
+                else:
+                    print(f"Failed to send {path.name} to trash: {error}")
+                    failed += 1
+
+            # Parent folders left empty go to the trash in a second batch
+            if parent_folders:
+                workers = min(TRASH_MAX_WORKERS, len(parent_folders))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    is_empty = list(executor.map(_should_cleanup_empty_folder, parent_folders))
+            else:
+                is_empty = []
+            empty_folders = [
+                str(folder) for folder, empty in zip(parent_folders, is_empty) if empty
+            ]
+            for folder, (success, error) in zip(empty_folders, _trash_batch(empty_folders)):
+                if success:
+                    folders_cleaned += 1
+                    debug_print(f"Cleaned up empty folder: {folder}")
+                else:
+                    debug_print(f"Could not cleanup empty folder {folder}: {error}")
+
         refresh_asset_browser(context)
 
         messages = []
@@ -308,32 +392,30 @@ class QAM_OT_delete_selected_assets(Operator):
         try:
             renamed_existing = []
             
-            # Use ALL datablock collections to preserve complete file contents
+            # Use ALL datablock collections to preserve complete file contents.
+            # The file is only read on leaving the with-block, so clashing
+            # local datablocks can be renamed out of the way inside it and a
+            # second load just to list the names is not needed.
             names_to_import = {}
             with bpy.data.libraries.load(str(blend_path), link=False, assets_only=False) as (data_from, data_to):
                 for collection_name in ALL_DATABLOCK_COLLECTIONS:
-                    if hasattr(data_from, collection_name):
-                        source = getattr(data_from, collection_name)
-                        if source:
-                            names_to_import[collection_name] = list(source)
-            
-            for collection_name, names in names_to_import.items():
-                if hasattr(bpy.data, collection_name):
-                    collection = getattr(bpy.data, collection_name)
-                    for name in names:
-                        if name in collection:
-                            existing_db = collection[name]
-                            temp_name = f"__QAM_DEL_TEMP_{name}_{id(existing_db)}"
-                            original_name = existing_db.name
-                            existing_db.name = temp_name
-                            renamed_existing.append((existing_db, original_name))
-            
-            with bpy.data.libraries.load(str(blend_path), link=False, assets_only=False) as (data_from, data_to):
-                for collection_name in ALL_DATABLOCK_COLLECTIONS:
-                    if hasattr(data_from, collection_name):
-                        source = getattr(data_from, collection_name)
-                        if source:
-                            setattr(data_to, collection_name, list(source))
+                    source = getattr(data_from, collection_name, None)
+                    if not source:
+                        continue
+                    names = list(source)
+                    names_to_import[collection_name] = names
+
+                    collection = getattr(bpy.data, collection_name, None)
+                    if collection is not None:
+                        for name in names:
+                            if name in collection:
+                                existing_db = collection[name]
+                                temp_name = f"__QAM_DEL_TEMP_{name}_{id(existing_db)}"
+                                original_name = existing_db.name
+                                existing_db.name = temp_name
+                                renamed_existing.append((existing_db, original_name))
+
+                    setattr(data_to, collection_name, names)
             
             imported_datablocks = set()
             for collection_name in names_to_import.keys():
@@ -359,8 +441,14 @@ class QAM_OT_delete_selected_assets(Operator):
                 compress=True,
             )
             
-            for db in list(imported_datablocks):
-                self._remove_datablock(db)
+            # One batched removal: a single ID-map update instead of one
+            # full relations update per datablock
+            try:
+                bpy.data.batch_remove(imported_datablocks)
+            except (RuntimeError, ReferenceError, TypeError) as e:
+                debug_print(f"Batch remove failed, removing one by one: {e}")
+                for db in list(imported_datablocks):
+                    self._remove_datablock(db)
             
             for existing_db, original_name in renamed_existing:
                 try:
@@ -368,15 +456,16 @@ class QAM_OT_delete_selected_assets(Operator):
                 except Exception:
                     pass
             
-            if temp_path.exists():
-                if blend_path.exists():
-                    blend_path.unlink()
-                shutil.move(str(temp_path), str(blend_path))
+            # Atomic swap in one call; the temp file sits next to the
+            # original, so this never degrades into a cross-device copy
+            try:
+                os.replace(temp_path, blend_path)
                 return True
+            except FileNotFoundError:
+                debug_print(f"No rewritten file was produced for {blend_path.name}")
                 
         except Exception as e:
             print(f"Error removing assets from {blend_path.name}: {e}")
-            import traceback
             traceback.print_exc()
             
             try:
@@ -390,27 +479,11 @@ class QAM_OT_delete_selected_assets(Operator):
     
     def _remove_datablock(self, datablock):
         """Safely remove a datablock from the current session."""
+        collection_name = _removal_collection_for(type(datablock))
+        if collection_name is None:
+            return
         try:
-            if isinstance(datablock, bpy.types.Object):
-                bpy.data.objects.remove(datablock)
-            elif isinstance(datablock, bpy.types.Material):
-                bpy.data.materials.remove(datablock)
-            elif isinstance(datablock, bpy.types.NodeTree):
-                bpy.data.node_groups.remove(datablock)
-            elif isinstance(datablock, bpy.types.World):
-                bpy.data.worlds.remove(datablock)
-            elif isinstance(datablock, bpy.types.Collection):
-                bpy.data.collections.remove(datablock)
-            elif isinstance(datablock, bpy.types.Mesh):
-                bpy.data.meshes.remove(datablock)
-            elif isinstance(datablock, bpy.types.Curve):
-                bpy.data.curves.remove(datablock)
-            elif isinstance(datablock, bpy.types.Armature):
-                bpy.data.armatures.remove(datablock)
-            elif isinstance(datablock, bpy.types.Action):
-                bpy.data.actions.remove(datablock)
-            elif isinstance(datablock, bpy.types.Brush):
-                bpy.data.brushes.remove(datablock)
+            getattr(bpy.data, collection_name).remove(datablock)
         except (RuntimeError, ReferenceError):
             pass
 
@@ -3,7 +3,8 @@ File I/O operations for Quick Asset Saver.
 Handles reading/writing .blend files, dependency collection, and asset extraction.
 """
 
-import shutil
+import os
+import stat
 from pathlib import Path
 
 import bpy
@@ -11,8 +12,75 @@ import bpy
 from .utils import debug_print, MIN_BLEND_FILE_SIZE, ASSET_DATABLOCK_COLLECTIONS
 from ..compatibility import get_sequencer_strips
 
+# Add-on key in bpy.context.preferences.addons, resolved once at import
+_ADDON_KEY = __package__.rsplit('.', 1)[0]
+
+# Keys of the dict returned by collect_external_dependencies
+_DEPENDENCY_KEYS = ('images', 'fonts', 'sounds', 'movieclips', 'volumes')
+
+# Branch of collect_external_dependencies taken for each bpy.types base.
+# 'no_refs' types have no materials, node trees or media of their own.
+_DATABLOCK_KINDS = tuple(
+    (base, kind)
+    for base, kind in (
+        (getattr(bpy.types, name, None), kind)
+        for name, kind in (
+            ('Material', 'material'),
+            ('NodeTree', 'node_tree'),
+            ('World', 'world'),
+            ('Light', 'light'),
+            ('Scene', 'scene'),
+            ('Object', 'object'),
+            ('Speaker', 'speaker'),
+            ('Volume', 'volume'),
+            ('Armature', 'no_refs'),
+            ('Action', 'no_refs'),
+            ('Camera', 'no_refs'),
+            ('Lattice', 'no_refs'),
+        )
+    )
+    if base is not None
+)
+
+# count_assets_in_blend results keyed by file path, reused while the file is
+# unchanged: str(blend_path) -> (mtime_ns, size, assets). Only successful
+# reads are stored, oldest entries evicted past ASSET_COUNT_CACHE_SIZE.
+_ASSET_COUNT_CACHE = {}
+ASSET_COUNT_CACHE_SIZE = 256
+
+# Concrete type (e.g. ShaderNodeTree, PointLight) -> kind, filled on first use
+_KIND_BY_TYPE = {}
+
+
+def _datablock_kind(datablock):
+    """Dispatch kind of a datablock, or None; resolved once per concrete type."""
+    cls = type(datablock)
+    try:
+        return _KIND_BY_TYPE[cls]
+    except KeyError:
+        pass
+    kind = None
+    for base, base_kind in _DATABLOCK_KINDS:
+        if issubclass(cls, base):
+            kind = base_kind
+            break
+    _KIND_BY_TYPE[cls] = kind
+    return kind
+
+
+def _new_dependencies():
+    """Empty result dict in the shape collect_external_dependencies returns."""
+    return {key: set() for key in _DEPENDENCY_KEYS}
 
-def collect_external_dependencies(datablock):
+
+def _merge_dependencies(target, source):
+    """Add every dependency in source into target (both dependency dicts)."""
+    for key, items in source.items():
+        if items:
+            target[key].update(items)
+
+
+def collect_external_dependencies(datablock, _cache=None):
     """
     Collect all external file dependencies used by a datablock.
 
@@ -29,112 +97,193 @@ def collect_external_dependencies(datablock):
 
     Args:
         datablock: Blender datablock (Object, Material, NodeTree, etc.)
+        _cache: Optional dict shared across calls (e.g. for every datablock
+                of one write). Results for datablocks, materials and node
+                trees are memoized in it by pointer, so resources shared
+                between datablocks are walked only once.
 
     Returns:
         dict: Dictionary with keys 'images', 'fonts', 'sounds', 'movieclips', 'volumes'
-              containing sets of respective datablock types
+              containing sets of respective datablock types. Without a _cache
+              the dict is a fresh one owned by the caller. With a _cache it is
+              the memoized entry, shared with later calls for the same
+              datablock: treat it as read-only and copy before modifying.
     
     Note:
         Libraries (linked .blend files) are noted but not packed.
         Volume files (.vdb) cannot be packed and will generate warnings.
     """
-    dependencies = {
-        'images': set(),
-        'fonts': set(),
-        'sounds': set(),
-        'movieclips': set(),
-        'volumes': set(),
-    }
+    kind = _datablock_kind(datablock)
+    if kind == 'no_refs':
+        return _new_dependencies()
+
+    if _cache is None:
+        _cache = {}
+
+    cache_key = ('id', datablock.as_pointer())
+    cached = _cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    dependencies = _new_dependencies()
+
+    def node_tree_dependencies(node_tree):
+        """Dependencies of a node tree and its nested groups, memoized per tree.
+
+        Nested groups are walked with an explicit stack and a set of visited
+        pointers, so a group reached through several parents (or nested in
+        itself) is only walked once.
+        """
+        key = ('node_tree', node_tree.as_pointer())
+        tree_deps = _cache.get(key)
+        if tree_deps is not None:
+            return tree_deps
+        tree_deps = _new_dependencies()
+        images = tree_deps['images']
+        clips = tree_deps['movieclips']
+
+        stack = [node_tree]
+        seen = set()
+        while stack:
+            tree = stack.pop()
+            ptr = tree.as_pointer()
+            if ptr in seen:
+                continue
+            seen.add(ptr)
+            if tree is not node_tree:
+                # A group already resolved in this write needs no re-walk
+                known = _cache.get(('node_tree', ptr))
+                if known is not None:
+                    _merge_dependencies(tree_deps, known)
+                    continue
+            for node in tree.nodes:
+                image = getattr(node, 'image', None)
+                if image:
+                    images.add(image)
+                clip = getattr(node, 'clip', None)
+                if clip:
+                    clips.add(clip)
+                if node.type == 'TEX_IES' and getattr(node, 'ies', None):
+                    pass
+                sub_tree = getattr(node, 'node_tree', None)
+                if sub_tree:
+                    stack.append(sub_tree)
+
+        _cache[key] = tree_deps
+        return tree_deps
+
+    def material_dependencies(material):
+        """Dependencies of a material, memoized per material."""
+        key = ('material', material.as_pointer())
+        mat_deps = _cache.get(key)
+        if mat_deps is not None:
+            return mat_deps
+        mat_deps = _cache[key] = _new_dependencies()
+        if material.use_nodes and material.node_tree:
+            _merge_dependencies(mat_deps, node_tree_dependencies(material.node_tree))
+        texture_slots = getattr(material, 'texture_slots', None)
+        if texture_slots:
+            for slot in texture_slots:
+                texture = slot.texture if slot else None
+                image = getattr(texture, 'image', None) if texture else None
+                if image:
+                    mat_deps['images'].add(image)
+        return mat_deps
+
+    # An object reaches the same material through its data and its slots;
+    # merge each material and tree into this result only once
+    merged = set()
 
     def collect_from_node_tree(node_tree):
         """Collect dependencies from a node tree."""
         if not node_tree:
             return
-        for node in node_tree.nodes:
-            if hasattr(node, 'image') and node.image:
-                dependencies['images'].add(node.image)
-            if hasattr(node, 'clip') and node.clip:
-                dependencies['movieclips'].add(node.clip)
-            if node.type == 'TEX_IES' and hasattr(node, 'ies') and node.ies:
-                pass
-            if hasattr(node, 'node_tree') and node.node_tree:
-                collect_from_node_tree(node.node_tree)
+        key = ('node_tree', node_tree.as_pointer())
+        if key in merged:
+            return
+        merged.add(key)
+        _merge_dependencies(dependencies, node_tree_dependencies(node_tree))
 
     def collect_from_material(material):
         """Collect dependencies from a material."""
         if not material:
             return
-        if material.use_nodes and material.node_tree:
-            collect_from_node_tree(material.node_tree)
-        if hasattr(material, 'texture_slots'):
-            for slot in material.texture_slots:
-                if slot and slot.texture:
-                    if hasattr(slot.texture, 'image') and slot.texture.image:
-                        dependencies['images'].add(slot.texture.image)
+        key = ('material', material.as_pointer())
+        if key in merged:
+            return
+        merged.add(key)
+        _merge_dependencies(dependencies, material_dependencies(material))
 
     def collect_from_object(obj):
         """Collect dependencies from an object and its modifiers."""
         if not obj:
             return
 
-        if obj.data:
-            if hasattr(obj.data, 'materials'):
-                for mat in obj.data.materials:
+        data = obj.data
+        if data:
+            materials = getattr(data, 'materials', None)
+            if materials is not None:
+                for mat in materials:
                     collect_from_material(mat)
 
-            if obj.type == 'FONT' and hasattr(obj.data, 'font'):
-                if obj.data.font:
-                    dependencies['fonts'].add(obj.data.font)
+            if obj.type == 'FONT' and hasattr(data, 'font'):
+                if data.font:
+                    dependencies['fonts'].add(data.font)
                 for font_attr in ['font_bold', 'font_italic', 'font_bold_italic']:
-                    font = getattr(obj.data, font_attr, None)
+                    font = getattr(data, font_attr, None)
                     if font:
                         dependencies['fonts'].add(font)
 
-        if hasattr(obj, 'material_slots'):
-            for slot in obj.material_slots:
+        material_slots = getattr(obj, 'material_slots', None)
+        if material_slots is not None:
+            for slot in material_slots:
                 if slot.material:
                     collect_from_material(slot.material)
 
-        if hasattr(obj, 'modifiers'):
-            for mod in obj.modifiers:
-                if hasattr(mod, 'texture') and mod.texture:
-                    if hasattr(mod.texture, 'image') and mod.texture.image:
-                        dependencies['images'].add(mod.texture.image)
-                
-                if mod.type == 'OCEAN' and hasattr(mod, 'filepath') and mod.filepath:
+        # One pass over the modifier stack for textures and node groups
+        modifiers = getattr(obj, 'modifiers', None)
+        if modifiers:
+            for mod in modifiers:
+                texture = getattr(mod, 'texture', None)
+                if texture:
+                    image = getattr(texture, 'image', None)
+                    if image:
+                        dependencies['images'].add(image)
+
+                if mod.type == 'OCEAN' and getattr(mod, 'filepath', None):
                     pass
-
-        if hasattr(obj, 'modifiers'):
-            for mod in obj.modifiers:
-                if mod.type == 'NODES' and hasattr(mod, 'node_group') and mod.node_group:
+                elif mod.type == 'NODES' and getattr(mod, 'node_group', None):
                     collect_from_node_tree(mod.node_group)
 
-    if isinstance(datablock, bpy.types.Material):
+    if kind == 'material':
         collect_from_material(datablock)
     
-    elif isinstance(datablock, bpy.types.NodeTree):
+    elif kind == 'node_tree':
         collect_from_node_tree(datablock)
     
-    elif isinstance(datablock, bpy.types.World):
+    elif kind == 'world':
         if datablock.use_nodes and datablock.node_tree:
             collect_from_node_tree(datablock.node_tree)
     
-    elif isinstance(datablock, bpy.types.Light):
-        if datablock.use_nodes and hasattr(datablock, 'node_tree') and datablock.node_tree:
-            collect_from_node_tree(datablock.node_tree)
+    elif kind == 'light':
+        if datablock.use_nodes:
+            collect_from_node_tree(getattr(datablock, 'node_tree', None))
     
-    elif isinstance(datablock, bpy.types.Scene):
+    elif kind == 'scene':
         if datablock.world:
             if datablock.world.use_nodes and datablock.world.node_tree:
                 collect_from_node_tree(datablock.world.node_tree)
-        if hasattr(datablock, 'sequence_editor') and datablock.sequence_editor:
-            for seq in get_sequencer_strips(datablock.sequence_editor):
-                if hasattr(seq, 'sound') and seq.sound:
-                    dependencies['sounds'].add(seq.sound)
-                if hasattr(seq, 'clip') and seq.clip:
-                    dependencies['movieclips'].add(seq.clip)
+        sequence_editor = getattr(datablock, 'sequence_editor', None)
+        if sequence_editor:
+            for seq in get_sequencer_strips(sequence_editor):
+                sound = getattr(seq, 'sound', None)
+                if sound:
+                    dependencies['sounds'].add(sound)
+                clip = getattr(seq, 'clip', None)
+                if clip:
+                    dependencies['movieclips'].add(clip)
     
-    elif isinstance(datablock, bpy.types.Object):
+    elif kind == 'object':
         collect_from_object(datablock)
         if datablock.data and hasattr(datablock.data, 'materials'):
             for mat in datablock.data.materials:
@@ -151,13 +300,14 @@ def collect_external_dependencies(datablock):
             if slot.material:
                 collect_from_material(slot.material)
     
-    if isinstance(datablock, bpy.types.Speaker):
+    if kind == 'speaker':
         if datablock.sound:
             dependencies['sounds'].add(datablock.sound)
     
-    if hasattr(bpy.types, 'Volume') and isinstance(datablock, bpy.types.Volume):
+    elif kind == 'volume':
         dependencies['volumes'].add(datablock)
 
+    _cache[cache_key] = dependencies
     return dependencies
 
 
@@ -214,18 +364,34 @@ def _restore_scene_references(cleared_refs):
             pass
 
 
-def collect_selected_assets_with_names(context):
+def _iter_selected_space_files(space_data):
     """
-    Collect selected assets with their file paths AND datablock names.
+    Yield the selected entries of a File Browser's file list.
 
-    Returns a tuple (assets, active_library) where:
-    - assets is a list of dicts: {'path': Path, 'name': str, 'id_type': str}
-    - active_library is the Blender preferences library object (or None)
-    
-    This is essential for asset-level operations in multi-asset .blend files.
-    """  
-    assets = []
-    
+    Filters while iterating, so the full list of visible files is never
+    copied just to pick out the selected few.
+    """
+    try:
+        for file_entry in space_data.files:
+            if getattr(file_entry, "select", False):
+                yield file_entry
+    except (AttributeError, TypeError, RuntimeError):
+        return
+
+
+def _resolve_asset_files(context):
+    """
+    Find the Asset Browser's active library and its selected asset files.
+
+    Shared by collect_selected_assets_with_names() and
+    collect_selected_asset_files().
+
+    Returns:
+        tuple: (asset_files, active_library, library_path) where asset_files
+               is an iterable (possibly a one-shot generator) or None,
+               active_library is the preferences library object (or None)
+               and library_path its Path (or None)
+    """
     prefs = context.preferences
     active_library = None
     params = getattr(context.space_data, "params", None)
@@ -236,10 +402,11 @@ def collect_selected_assets_with_names(context):
         if not asset_lib_ref and hasattr(params, "asset_library_ref"):
             asset_lib_ref = params.asset_library_ref
         if asset_lib_ref and hasattr(prefs, "filepaths") and hasattr(prefs.filepaths, "asset_libraries"):
+            # First library wins on duplicate names, as with a linear scan
+            libraries_by_name = {}
             for lib in prefs.filepaths.asset_libraries:
-                if getattr(lib, "name", None) == asset_lib_ref:
-                    active_library = lib
-                    break
+                libraries_by_name.setdefault(getattr(lib, "name", None), lib)
+            active_library = libraries_by_name.get(asset_lib_ref)
 
     library_path = Path(active_library.path) if active_library and getattr(active_library, "path", None) else None
 
@@ -249,48 +416,65 @@ def collect_selected_assets_with_names(context):
     elif hasattr(context, "selected_assets") and context.selected_assets is not None:
         asset_files = context.selected_assets
     elif hasattr(context.space_data, "files"):
-        try:
-            asset_files = [f for f in context.space_data.files if getattr(f, "select", False)]
-        except (AttributeError, TypeError, RuntimeError):
-            asset_files = None
+        asset_files = _iter_selected_space_files(context.space_data)
 
-    if not asset_files:
+    return asset_files, active_library, library_path
+
+
+def collect_selected_assets_with_names(context):
+    """
+    Collect selected assets with their file paths AND datablock names.
+
+    Returns a tuple (assets, active_library) where:
+    - assets is a list of dicts: {'path': Path, 'name': str, 'id_type': str}
+    - active_library is the Blender preferences library object (or None)
+    
+    This is essential for asset-level operations in multi-asset .blend files.
+    """  
+    assets = []
+    
+    asset_files, active_library, library_path = _resolve_asset_files(context)
+    if asset_files is None:
         return [], active_library
 
     for asset_file in asset_files:
-        asset_path = None
-        asset_name = None
-        id_type = None
-        
-        if hasattr(asset_file, "name"):
-            asset_name = asset_file.name
-        
-        if hasattr(asset_file, "id_type"):
-            id_type = asset_file.id_type
-        elif hasattr(asset_file, "asset_data") and hasattr(asset_file.asset_data, "id_type"):
-            id_type = asset_file.asset_data.id_type
-        
-        if hasattr(asset_file, "full_library_path") and asset_file.full_library_path:
-            asset_path = Path(asset_file.full_library_path)
-        elif hasattr(asset_file, "full_path") and asset_file.full_path:
-            asset_path = Path(asset_file.full_path)
-        elif hasattr(asset_file, "relative_path") and library_path:
-            asset_path = library_path / asset_file.relative_path
+        asset_name = getattr(asset_file, "name", None)
+
+        id_type = getattr(asset_file, "id_type", None)
+        if id_type is None:
+            id_type = getattr(getattr(asset_file, "asset_data", None), "id_type", None)
+
+        full_library_path = getattr(asset_file, "full_library_path", None)
+        full_path = getattr(asset_file, "full_path", None) if not full_library_path else None
+        relative_path = getattr(asset_file, "relative_path", None)
+        base_path = None
+        if full_library_path:
+            raw_path = full_library_path
+        elif full_path:
+            raw_path = full_path
+        elif relative_path is not None and library_path:
+            raw_path, base_path = relative_path, library_path
         elif asset_name and library_path:
-            potential_path = library_path / (asset_name if asset_name.endswith(".blend") else f"{asset_name}.blend")
-            if potential_path.exists():
-                asset_path = potential_path
-
-        if asset_path and asset_path.exists() and asset_path.is_file() and asset_path.suffix.lower() == ".blend":
-            try:
-                if asset_path.stat().st_size > MIN_BLEND_FILE_SIZE:
-                    assets.append({
-                        'path': asset_path,
-                        'name': asset_name,
-                        'id_type': id_type
-                    })
-            except Exception:
-                pass
+            raw_path = asset_name if asset_name.endswith(".blend") else f"{asset_name}.blend"
+            base_path = library_path
+        else:
+            continue
+
+        # Cheap string test before building a Path or touching the disk
+        if not raw_path.lower().endswith(".blend"):
+            continue
+        asset_path = base_path / raw_path if base_path else Path(raw_path)
+        # One stat() answers exists, is-a-file and size together
+        try:
+            st = asset_path.stat()
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode) and st.st_size > MIN_BLEND_FILE_SIZE:
+            assets.append({
+                'path': asset_path,
+                'name': asset_name,
+                'id_type': id_type
+            })
 
     return assets, active_library
 
@@ -301,27 +485,69 @@ def count_assets_in_blend(blend_path):
     
     Returns a dict with asset count and list of asset info:
     {'count': int, 'assets': [{'name': str, 'type': str}, ...]}
+
+    Results are cached per file on (mtime_ns, size), so the delete dialog's
+    invoke/execute and repeated moves don't re-open an unchanged file.
     """
+    cache_key = str(blend_path)
+    try:
+        st = os.stat(cache_key)
+    except OSError:
+        _ASSET_COUNT_CACHE.pop(cache_key, None)
+        st = None
+
+    if st is not None:
+        cached = _ASSET_COUNT_CACHE.get(cache_key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            # Fresh list so callers can't mutate the cached one
+            assets = list(cached[2])
+            return {'count': len(assets), 'assets': assets}
+
     result = {'count': 0, 'assets': []}
+    loaded = False
     
     try:
         with bpy.data.libraries.load(str(blend_path), link=False, assets_only=True) as (data_from, data_to):
+            assets = result['assets']
             for collection_name in ASSET_DATABLOCK_COLLECTIONS:
-                if hasattr(data_from, collection_name):
-                    source = getattr(data_from, collection_name)
-                    if source:
-                        for name in source:
-                            result['assets'].append({
-                                'name': name,
-                                'type': collection_name
-                            })
-                            result['count'] += 1
+                source = getattr(data_from, collection_name, None)
+                if not source:
+                    continue
+                assets.extend(
+                    {'name': name, 'type': collection_name} for name in source
+                )
+        loaded = True
     except Exception as e:
         debug_print(f"Error counting assets in {blend_path}: {e}")
-    
+
+    # Set after the try so a partial read still reports a matching count
+    result['count'] = len(result['assets'])
+
+    # A failed read (locked, half-written, newer version) is retried next time
+    if loaded and st is not None:
+        _ASSET_COUNT_CACHE.pop(cache_key, None)
+        while len(_ASSET_COUNT_CACHE) >= ASSET_COUNT_CACHE_SIZE:
+            del _ASSET_COUNT_CACHE[next(iter(_ASSET_COUNT_CACHE))]
+        _ASSET_COUNT_CACHE[cache_key] = (st.st_mtime_ns, st.st_size, tuple(result['assets']))
     return result
 
 
+def count_assets_in_blends(blend_paths):
+    """
+    Count the assets of several .blend files, reading each file once.
+
+    Files are read one after another: bpy.data is not thread-safe, so
+    libraries.load() must not run from worker threads.
+
+    Args:
+        blend_paths: Iterable of paths; duplicates are only read once
+
+    Returns:
+        dict: {path: count_assets_in_blend(path)} in first-seen order
+    """
+    return {path: count_assets_in_blend(path) for path in dict.fromkeys(blend_paths)}
+
+
 def collect_selected_asset_files(context):
     """
     Collect absolute Paths to selected asset .blend files in the active Asset Browser.
@@ -332,59 +558,48 @@ def collect_selected_asset_files(context):
     Note: For asset-level operations, use collect_selected_assets_with_names() instead.
     """
     asset_paths = []
-    asset_blend_files = set()
-
-    prefs = context.preferences
-    active_library = None
-    params = getattr(context.space_data, "params", None)
-    if params is not None:
-        asset_lib_ref = None
-        if hasattr(params, "asset_library_reference"):
-            asset_lib_ref = params.asset_library_reference
-        if not asset_lib_ref and hasattr(params, "asset_library_ref"):
-            asset_lib_ref = params.asset_library_ref
-        if asset_lib_ref and hasattr(prefs, "filepaths") and hasattr(prefs.filepaths, "asset_libraries"):
-            for lib in prefs.filepaths.asset_libraries:
-                if getattr(lib, "name", None) == asset_lib_ref:
-                    active_library = lib
-                    break
-
-    library_path = Path(active_library.path) if active_library and getattr(active_library, "path", None) else None
-
-    asset_files = None
-    if hasattr(context, "selected_asset_files") and context.selected_asset_files is not None:
-        asset_files = context.selected_asset_files
-    elif hasattr(context, "selected_assets") and context.selected_assets is not None:
-        asset_files = context.selected_assets
-    elif hasattr(context.space_data, "files"):
-        try:
-            asset_files = [f for f in context.space_data.files if getattr(f, "select", False)]
-        except (AttributeError, TypeError, RuntimeError):
-            asset_files = None
+    # Dedup on the path string (cheaper to hash than Path) in selection order
+    seen_paths = set()
 
-    if not asset_files:
+    asset_files, active_library, library_path = _resolve_asset_files(context)
+    if asset_files is None:
         return [], active_library
 
     for asset_file in asset_files:
-        asset_path = None
-        if hasattr(asset_file, "full_library_path") and asset_file.full_library_path:
-            asset_path = Path(asset_file.full_library_path)
-        elif hasattr(asset_file, "full_path") and asset_file.full_path:
-            asset_path = Path(asset_file.full_path)
-        elif hasattr(asset_file, "relative_path") and library_path:
-            asset_path = library_path / asset_file.relative_path
-        elif hasattr(asset_file, "name") and library_path:
-            name = asset_file.name
-            asset_path = library_path / (name if name.endswith(".blend") else f"{name}.blend")
-
-        if asset_path and asset_path.exists() and asset_path.is_file() and asset_path.suffix.lower() == ".blend":
-            try:
-                if asset_path.stat().st_size > MIN_BLEND_FILE_SIZE:
-                    asset_blend_files.add(asset_path)
-            except Exception:
-                pass
+        full_library_path = getattr(asset_file, "full_library_path", None)
+        full_path = getattr(asset_file, "full_path", None) if not full_library_path else None
+        relative_path = getattr(asset_file, "relative_path", None)
+        name = getattr(asset_file, "name", None)
+        base_path = None
+        if full_library_path:
+            raw_path = full_library_path
+        elif full_path:
+            raw_path = full_path
+        elif relative_path is not None and library_path:
+            raw_path, base_path = relative_path, library_path
+        elif name is not None and library_path:
+            raw_path = name if name.endswith(".blend") else f"{name}.blend"
+            base_path = library_path
+        else:
+            continue
+
+        # Cheap string test before building a Path or touching the disk
+        if not raw_path.lower().endswith(".blend"):
+            continue
+        asset_path = base_path / raw_path if base_path else Path(raw_path)
+        # Several selected assets can share a file; check it only once
+        path_key = str(asset_path)
+        if path_key in seen_paths:
+            continue
+        seen_paths.add(path_key)
+        # One stat() answers exists, is-a-file and size together
+        try:
+            st = asset_path.stat()
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode) and st.st_size > MIN_BLEND_FILE_SIZE:
+            asset_paths.append(asset_path)
 
-    asset_paths = list(asset_blend_files)
     return asset_paths, active_library
 
 
@@ -417,114 +632,95 @@ def write_blend_file(filepath, datablocks):
         temp_dir = filepath.parent
         temp_file = temp_dir / f".tmp_{filepath.name}"
 
-        for datablock in datablocks:
-            if isinstance(datablock, bpy.types.NodeTree):
-                cleared_scene_refs.extend(_strip_scene_references(datablock))
-
-        all_dependencies = {
-            'images': set(),
-            'fonts': set(),
-            'sounds': set(),
-            'movieclips': set(),
-            'volumes': set(),
-        }
-        
-        for datablock in datablocks:
-            deps = collect_external_dependencies(datablock)
-            for key in all_dependencies:
-                all_dependencies[key].update(deps[key])
-
-        for image in all_dependencies['images']:
-            if image and image.source == 'FILE' and not image.packed_file:
+        # Everything packed or stripped below is put back by the finally
+        # clause, whether or not the write succeeds
+        try:
+            for datablock in datablocks:
+                if isinstance(datablock, bpy.types.NodeTree):
+                    cleared_scene_refs.extend(_strip_scene_references(datablock))
+
+            all_dependencies = _new_dependencies()
+
+            # One cache for the whole write: materials and node groups shared
+            # by several datablocks are only walked once
+            dependency_cache = {}
+            for datablock in datablocks:
+                # Empty kinds (most of them, for most datablocks) are skipped
+                _merge_dependencies(
+                    all_dependencies,
+                    collect_external_dependencies(datablock, dependency_cache),
+                )
+
+            # Items are recorded before pack() so a partial pack is restored too
+            packed_items['images'] = [
+                image for image in all_dependencies['images']
+                if image and image.source == 'FILE' and not image.packed_file
+            ]
+            for image in packed_items['images']:
                 try:
-                    packed_items['images'].append(image)
                     image.pack()
                     debug_print(f"Packed image: {image.name}")
                 except Exception as e:
                     print(f"Warning: Could not pack image '{image.name}': {e}")
 
-        for font in all_dependencies['fonts']:
-            if font and not font.packed_file:
-                if font.filepath and font.filepath != '<builtin>':
-                    try:
-                        packed_items['fonts'].append(font)
-                        font.pack()
-                        debug_print(f"Packed font: {font.name}")
-                    except Exception as e:
-                        print(f"Warning: Could not pack font '{font.name}': {e}")
-
-        for sound in all_dependencies['sounds']:
-            if sound and not sound.packed_file:
+            packed_items['fonts'] = [
+                font for font in all_dependencies['fonts']
+                if font and not font.packed_file
+                and font.filepath and font.filepath != '<builtin>'
+            ]
+            for font in packed_items['fonts']:
+                try:
+                    font.pack()
+                    debug_print(f"Packed font: {font.name}")
+                except Exception as e:
+                    print(f"Warning: Could not pack font '{font.name}': {e}")
+
+            packed_items['sounds'] = [
+                sound for sound in all_dependencies['sounds']
+                if sound and not sound.packed_file
+            ]
+            for sound in packed_items['sounds']:
                 try:
-                    packed_items['sounds'].append(sound)
                     sound.pack()
                     debug_print(f"Packed sound: {sound.name}")
                 except Exception as e:
                     print(f"Warning: Could not pack sound '{sound.name}': {e}")
 
-        for clip in all_dependencies['movieclips']:
-            if clip and hasattr(clip, 'packed_file') and not clip.packed_file:
+            packed_items['movieclips'] = [
+                clip for clip in all_dependencies['movieclips']
+                if clip and hasattr(clip, 'packed_file') and not clip.packed_file
+            ]
+            for clip in packed_items['movieclips']:
                 try:
-                    packed_items['movieclips'].append(clip)
                     clip.pack()
                     debug_print(f"Packed movie clip: {clip.name}")
                 except Exception as e:
                     print(f"Warning: Could not pack movie clip '{clip.name}': {e}")
 
-        for volume in all_dependencies['volumes']:
-            if volume and hasattr(volume, 'filepath') and volume.filepath:
-                print(f"Warning: Volume '{volume.name}' has external file '{volume.filepath}' which cannot be packed. "
-                      "Consider placing the VDB file in a location accessible from the asset library.")
-
-        bpy.data.libraries.write(
-            str(temp_file),
-            datablocks,
-            path_remap="RELATIVE_ALL",
-            fake_user=True,
-            compress=True,
-        )
-
-        _restore_scene_references(cleared_scene_refs)
-        cleared_scene_refs = []
-
-        for image in packed_items['images']:
-            try:
-                if image.packed_file:
-                    image.unpack(method='USE_ORIGINAL')
-            except Exception as e:
-                debug_print(f"Could not restore image '{image.name}': {e}")
-
-        for font in packed_items['fonts']:
-            try:
-                if font.packed_file:
-                    font.unpack(method='USE_ORIGINAL')
-            except Exception as e:
-                debug_print(f"Could not restore font '{font.name}': {e}")
-
-        for sound in packed_items['sounds']:
-            try:
-                if sound.packed_file:
-                    sound.unpack(method='USE_ORIGINAL')
-            except Exception as e:
-                debug_print(f"Could not restore sound '{sound.name}': {e}")
-
-        for clip in packed_items['movieclips']:
-            try:
-                if hasattr(clip, 'packed_file') and clip.packed_file:
-                    clip.unpack(method='USE_ORIGINAL')
-            except Exception as e:
-                debug_print(f"Could not restore movie clip '{clip.name}': {e}")
-
-        if filepath.exists():
-            filepath.unlink()
-
-        shutil.move(str(temp_file), str(filepath))
+            for volume in all_dependencies['volumes']:
+                if volume and hasattr(volume, 'filepath') and volume.filepath:
+                    print(f"Warning: Volume '{volume.name}' has external file '{volume.filepath}' which cannot be packed. "
+                          "Consider placing the VDB file in a location accessible from the asset library.")
+
+            bpy.data.libraries.write(
+                str(temp_file),
+                datablocks,
+                path_remap="RELATIVE_ALL",
+                fake_user=True,
+                compress=True,
+            )
+        finally:
+            _restore_scene_references(cleared_scene_refs)
+            _restore_packed_items(packed_items)
+
+        # The temp file sits next to the target, so this is an atomic
+        # rename that also replaces an existing file
+        os.replace(temp_file, filepath)
+        _ASSET_COUNT_CACHE.pop(str(filepath), None)
         return True
 
     except (OSError, IOError) as e:
         print(f"Error writing blend file: {e}")
-        _restore_scene_references(cleared_scene_refs)
-        _restore_packed_items(packed_items)
         if temp_file and temp_file.exists():
             try:
                 temp_file.unlink()
@@ -533,7 +729,6 @@ def write_blend_file(filepath, datablocks):
         return False
     except (RuntimeError, ValueError) as e:
         print(f"Blender API error writing blend file: {e}")
-        _restore_packed_items(packed_items)
         if temp_file and temp_file.exists():
             try:
                 temp_file.unlink()
@@ -547,41 +742,28 @@ def _restore_packed_items(packed_items):
     Restore unpacked state for all temporarily packed items.
     
     Called after saving to restore the session state, or on error to clean up.
-    Silently handles individual failures to ensure all items are attempted.
+    Individual failures are only logged in debug mode, so all items are attempted.
     
     Args:
         packed_items (dict): Dictionary with keys matching dependency types,
                            each containing a list of datablocks to restore
     """
-    for image in packed_items.get('images', []):
-        try:
-            if image.packed_file:
-                image.unpack(method='USE_ORIGINAL')
-        except (RuntimeError, AttributeError):
-            pass
-    
-    for font in packed_items.get('fonts', []):
-        try:
-            if font.packed_file:
-                font.unpack(method='USE_ORIGINAL')
-        except (RuntimeError, AttributeError):
-            pass
-    
-    for sound in packed_items.get('sounds', []):
-        try:
-            if sound.packed_file:
-                sound.unpack(method='USE_ORIGINAL')
-        except (RuntimeError, AttributeError):
-            pass
-    
-    for clip in packed_items.get('movieclips', []):
-        try:
-            if hasattr(clip, 'packed_file') and clip.packed_file:
-                clip.unpack(method='USE_ORIGINAL')
-        except (RuntimeError, AttributeError):
-            pass
+    for kind, label in (
+        ('images', 'image'),
+        ('fonts', 'font'),
+        ('sounds', 'sound'),
+        ('movieclips', 'movie clip'),
+    ):
+        for item in packed_items.get(kind, ()):
+            # Read packed_file once; movie clips may not expose it at all
+            if getattr(item, 'packed_file', None) is None:
+                continue
+            try:
+                item.unpack(method='USE_ORIGINAL')
+            except (RuntimeError, AttributeError) as e:
+                debug_print(f"Could not restore {label} '{item.name}': {e}")
 
 
 def get_addon_preferences():
     """Get the addon preferences object."""
-    return bpy.context.preferences.addons.get(__package__.rsplit('.', 1)[0], None)
+    return bpy.context.preferences.addons.get(_ADDON_KEY, None)
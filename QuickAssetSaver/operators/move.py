@@ -3,6 +3,7 @@ Move operator for Quick Asset Saver.
 Handles moving assets between libraries with full companion file support.
 """
 
+import os
 import shutil
 import time
 from pathlib import Path
@@ -16,35 +17,50 @@ try:
     def move_to_trash(path) -> None:
         _send2trash(str(path))
 
+    def move_many_to_trash(paths) -> None:
+        # One call for the whole list: a single shell operation on Windows/macOS
+        _send2trash([str(p) for p in paths])
+
 except ImportError:
     def move_to_trash(path) -> None:
-        from pathlib import Path
         p = Path(path)
         raise RuntimeError(
             f"Send2Trash is unavailable. '{p.name}' was NOT deleted.\n"
             f"You can delete it manually at: {p.parent}"
         )
 
+    def move_many_to_trash(paths) -> None:
+        raise RuntimeError(
+            f"Send2Trash is unavailable. {len(paths)} item(s) were NOT deleted."
+        )
+
 from .utils import (
     debug_print,
     sanitize_name,
     increment_filename,
+    increment_filename_from_set,
+    scan_existing_filenames,
     refresh_asset_browser,
+    collect_companions_for_file,
+    PROTECTED_FILENAMES,
     ALL_DATABLOCK_COLLECTIONS,
     ASSET_DATABLOCK_COLLECTIONS,
+    BLEND_DATA_COLLECTIONS,
 )
 from ..constants import (
-    COMPANION_FOLDER_GROUPS,
     THUMBNAIL_EXTENSIONS,
     METADATA_EXTENSIONS,
 )
 from .catalog import get_catalog_path_from_uuid
 from .file_io import (
     collect_selected_assets_with_names,
-    count_assets_in_blend,
+    count_assets_in_blends,
     write_blend_file,
 )
 
+# OS-generated files that don't stop an otherwise empty folder being cleaned up
+_SYSTEM_FILES = frozenset({'desktop.ini', 'Thumbs.db', '.DS_Store'})
+
 
 def _should_cleanup_empty_folder(folder_path):
     """Check if a folder is empty or only contains hidden/system files.
@@ -54,53 +70,54 @@ def _should_cleanup_empty_folder(folder_path):
     CRITICAL: NEVER returns True for folders containing blender_assets.cats.txt
     or any library root folder. This protects catalog definitions.
     """
-    if not folder_path.exists() or not folder_path.is_dir():
-        return False
-    
+    # One streamed listing, stopping at the first entry that keeps the
+    # folder; a missing folder or a non-directory fails the scandir itself
     try:
-        # NEVER cleanup folders containing catalog files - these are library roots!
-        catalog_file = folder_path / "blender_assets.cats.txt"
-        if catalog_file.exists():
-            debug_print(f"PROTECTED: {folder_path} contains catalog file, will not cleanup")
-            return False
-        
-        # Get all contents
-        contents = list(folder_path.iterdir())
-        
-        # Empty folder - should be cleaned up
-        if not contents:
-            return True
-        
-        # Check if only contains hidden/system files
-        for item in contents:
-            name = item.name
-            # Skip hidden files and common system files
-            if name.startswith('.') or name.startswith('~') or name in ['desktop.ini', 'Thumbs.db', '.DS_Store']:
-                continue
-            # Found a real file/folder - don't cleanup
-            return False
-        
-        # Only hidden/system files found - cleanup
-        return True
-        
-    except Exception:
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                name = entry.name
+                # NEVER cleanup folders containing catalog files - these are library roots!
+                if name == "blender_assets.cats.txt":
+                    debug_print(f"PROTECTED: {folder_path} contains catalog file, will not cleanup")
+                    return False
+                # Skip hidden files and common system files
+                if name.startswith(('.', '~')) or name in _SYSTEM_FILES:
+                    continue
+                # Found a real file/folder - don't cleanup
+                return False
+    except OSError:
         return False
 
+    # Empty, or only hidden/system files found - cleanup
+    return True
+
 
-def _resolve_move_conflict(dest, conflict_resolution):
+def _resolve_move_conflict(dest, conflict_resolution, existing=None):
     """Resolve a destination path against an existing-file conflict.
 
+    If existing (a set from scan_existing_filenames for dest's folder) is
+    given, conflicts are checked in memory and the chosen name is recorded
+    in it, so a batch of moves into one folder needs no per-file stat.
+
     Returns (final_dest, skip). If skip is True, the caller should skip
     this item entirely (user chose to skip files that already exist).
     """
-    if not dest.exists():
+    if existing is None:
+        exists = dest.exists()
+    else:
+        exists = os.path.normcase(dest.name) in existing
+    if not exists:
+        if existing is not None:
+            existing.add(os.path.normcase(dest.name))
         return dest, False
     if conflict_resolution == "OVERWRITE":
         return dest, False
     if conflict_resolution == "CANCEL":  # "Skip" in the UI
         return dest, True
     # INCREMENT (default)
-    return increment_filename(dest.parent, dest.stem, dest.suffix), False
+    if existing is None:
+        return increment_filename(dest.parent, dest.stem, dest.suffix), False
+    return increment_filename_from_set(dest.parent, dest.stem, dest.suffix, existing), False
 
 
 class QAM_OT_move_selected_to_library(Operator):
@@ -189,19 +206,32 @@ class QAM_OT_move_selected_to_library(Operator):
             self.report({"ERROR"}, f"Could not create destination folders: {e}")
             return {"CANCELLED"}
 
+        # Every destination lives in dest_base: for a batch, scan it once for
+        # conflicts; a single move just probes its one destination
+        existing_names = None
+        if len(selected_assets) > 1:
+            existing_names = scan_existing_filenames(dest_base)
+
+        # A whole-file move keeps the file name, so "same location" only
+        # depends on the folders: resolve dest_base once and each source
+        # folder at most once, instead of both full paths per file
+        try:
+            dest_base_resolved = dest_base.resolve()
+        except (OSError, RuntimeError):
+            dest_base_resolved = None
+        resolved_parents = {}
+
         moved = 0
         extracted = 0
         skipped = 0
         
-        files_to_process = {}
+        asset_infos = count_assets_in_blends(asset['path'] for asset in selected_assets)
+        files_to_process = {
+            path: {'asset_info': info, 'selected_assets': []}
+            for path, info in asset_infos.items()
+        }
         for asset in selected_assets:
-            path = asset['path']
-            if path not in files_to_process:
-                files_to_process[path] = {
-                    'asset_info': count_assets_in_blend(path),
-                    'selected_assets': []
-                }
-            files_to_process[path]['selected_assets'].append(asset['name'])
+            files_to_process[asset['path']]['selected_assets'].append(asset['name'])
         
         catalog_to_set = "" if target_catalog_uuid == "UNASSIGNED" else target_catalog_uuid
         
@@ -218,10 +248,14 @@ class QAM_OT_move_selected_to_library(Operator):
                     dest = dest_base / src_path.name
                     
                     same_location = False
-                    try:
-                        same_location = src_path.resolve() == dest.resolve()
-                    except Exception:
-                        pass
+                    if dest_base_resolved is not None:
+                        src_parent = src_path.parent
+                        if src_parent not in resolved_parents:
+                            try:
+                                resolved_parents[src_parent] = src_parent.resolve()
+                            except (OSError, RuntimeError):
+                                resolved_parents[src_parent] = None
+                        same_location = resolved_parents[src_parent] == dest_base_resolved
                     
                     debug_print(f"[Move Debug] Same location check: {same_location}, catalog_to_set: {catalog_to_set}")
                     
@@ -238,7 +272,9 @@ class QAM_OT_move_selected_to_library(Operator):
                             debug_print("[Move Debug] Failed to update catalog")
                         continue
                     
-                    dest, skip = _resolve_move_conflict(dest, manage.move_conflict_resolution)
+                    dest, skip = _resolve_move_conflict(
+                        dest, manage.move_conflict_resolution, existing_names
+                    )
                     if skip:
                         skipped += 1
                         continue
@@ -257,7 +293,9 @@ class QAM_OT_move_selected_to_library(Operator):
                             dest_filename = f"{sanitize_name(asset_name)}.blend"
                             dest = dest_base / dest_filename
                             
-                            dest, skip = _resolve_move_conflict(dest, manage.move_conflict_resolution)
+                            dest, skip = _resolve_move_conflict(
+                                dest, manage.move_conflict_resolution, existing_names
+                            )
                             if skip:
                                 skipped += 1
                                 continue
@@ -302,10 +340,6 @@ class QAM_OT_move_selected_to_library(Operator):
         datablock stays in the current file — we cannot safely delete it
         without modifying the user's unsaved work.
         """
-        from .utils import sanitize_name, refresh_asset_browser
-        from .file_io import write_blend_file
-        from .catalog import get_catalog_path_from_uuid
-
         target_catalog_uuid = manage.move_target_catalog if manage.move_target_catalog else "UNASSIGNED"
 
         # Build destination base (respects catalog subfolders preference)
@@ -333,6 +367,11 @@ class QAM_OT_move_selected_to_library(Operator):
             self.report({"WARNING"}, "No assets selected")
             return {"CANCELLED"}
 
+        # Scan dest_base once only when several assets may conflict in it
+        existing_names = None
+        if len(asset_files) > 1:
+            existing_names = scan_existing_filenames(dest_base)
+
         saved = 0
         skipped = 0
 
@@ -349,7 +388,9 @@ class QAM_OT_move_selected_to_library(Operator):
             # Build destination path
             filename = sanitize_name(local_id.name)
             dest_path = dest_base / f"{filename}.blend"
-            dest_path, skip = _resolve_move_conflict(dest_path, manage.move_conflict_resolution)
+            dest_path, skip = _resolve_move_conflict(
+                dest_path, manage.move_conflict_resolution, existing_names
+            )
             if skip:
                 skipped += 1
                 continue
@@ -397,9 +438,6 @@ class QAM_OT_move_selected_to_library(Operator):
         stem = src_path.stem
         parent = src_path.parent
         
-        # Files that are NEVER companions - they belong to the library
-        protected_files = {'blender_assets.cats.txt'}
-        
         # Check for thumbnails
         for ext in THUMBNAIL_EXTENSIONS:
             if (parent / f"{stem}{ext}").exists():
@@ -418,7 +456,7 @@ class QAM_OT_move_selected_to_library(Operator):
                 return True
             # Check for stem-prefixed files (e.g., asset_name_info.json)
             for f in parent.glob(f"{stem}*{ext}"):
-                if f.is_file() and f.name not in protected_files:
+                if f.is_file() and os.path.normcase(f.name) not in PROTECTED_FILENAMES:
                     return True
         
         # NOTE: We intentionally do NOT check for generic companion folders like
@@ -543,9 +581,6 @@ class QAM_OT_move_selected_to_library(Operator):
         src_parent = src_path.parent
         dest_parent = dest_path.parent
         
-        # Files that should NEVER be copied
-        protected_files = {'blender_assets.cats.txt'}
-        
         # Copy thumbnails - both stem-named and generic "thumbnail" named
         for ext in THUMBNAIL_EXTENSIONS:
             # Check for stem-named thumbnails (e.g., brick_floor_003.png)
@@ -592,7 +627,7 @@ class QAM_OT_move_selected_to_library(Operator):
             
             # Prefixed files (e.g., asset_name_info.json) - but not catalog files
             for src_file in src_parent.glob(f"{src_stem}_*{ext}"):
-                if src_file.is_file() and src_file.name not in protected_files:
+                if src_file.is_file() and os.path.normcase(src_file.name) not in PROTECTED_FILENAMES:
                     # Preserve the suffix part of the filename
                     suffix = src_file.name[len(src_stem):]
                     dest_file = dest_parent / f"{dest_stem}{suffix}"
@@ -617,41 +652,24 @@ class QAM_OT_move_selected_to_library(Operator):
         - Asset-named subfolders: {stem}/
         - Metadata files: *.json, *.txt, *.md, *.xml
         """
-        items_to_trash = [src_path]
-        
-        stem = src_path.stem
-        parent = src_path.parent
-        
-        # Collect thumbnails - both stem-named and generic "thumbnail" named
-        for ext in THUMBNAIL_EXTENSIONS:
-            thumbnail_path = parent / f"{stem}{ext}"
-            if thumbnail_path.exists():
-                items_to_trash.append(thumbnail_path)
-            thumbnail_path = parent / f"thumbnail{ext}"
-            if thumbnail_path.exists():
-                items_to_trash.append(thumbnail_path)
-        
-        # Collect common asset companion folders
-        for folder_group in COMPANION_FOLDER_GROUPS:
-            for folder_name in folder_group:
-                folder_path = parent / folder_name
-                if folder_path.exists() and folder_path.is_dir():
-                    items_to_trash.append(folder_path)
-                    break  # Only trash one folder per group
-        
-        # Collect asset-named subfolder
-        asset_folder = parent / stem
-        if asset_folder.exists() and asset_folder.is_dir():
-            items_to_trash.append(asset_folder)
-        
-        # Collect metadata files - but NEVER touch catalog files!
-        protected_files = {'blender_assets.cats.txt'}
-        for ext in METADATA_EXTENSIONS:
-            for f in parent.glob(f"*{ext}"):
-                if f.is_file() and f not in items_to_trash and f.name not in protected_files:
-                    items_to_trash.append(f)
-        
+        # Same companion matching as the delete operator
+        items_to_trash = [src_path] + [
+            Path(item) for item in collect_companions_for_file(src_path)
+        ]
+
+        # One batched call; only fall back to per-item handling on failure
+        try:
+            move_many_to_trash(items_to_trash)
+            for item in items_to_trash:
+                debug_print(f"Sent to recycle bin: {item}")
+            return
+        except Exception as e:
+            debug_print(f"Batched trash failed, retrying items one by one: {e}")
+
         for item in items_to_trash:
+            # A failed batch may already have trashed part of the list
+            if not os.path.lexists(item):
+                continue
             try:
                 move_to_trash(str(item))
                 debug_print(f"Sent to recycle bin: {item}")
@@ -678,36 +696,34 @@ class QAM_OT_move_selected_to_library(Operator):
         """
         try:
             target_collection = None
+            collection = None
+            renamed_existing = []
+            # One load both finds the asset and imports it: data_to is only
+            # read when the block exits, so the rename below happens in time
             with bpy.data.libraries.load(str(src_path), link=False, assets_only=True) as (data_from, data_to):
                 for collection_name in ASSET_DATABLOCK_COLLECTIONS:
-                    if hasattr(data_from, collection_name):
-                        source = getattr(data_from, collection_name)
-                        if source and asset_name in source:
-                            target_collection = collection_name
-                            break
+                    source = getattr(data_from, collection_name, None)
+                    if source and asset_name in source:
+                        target_collection = collection_name
+                        break
+
+                if target_collection:
+                    if target_collection in BLEND_DATA_COLLECTIONS:
+                        collection = getattr(bpy.data, target_collection)
+                        existing_db = collection.get(asset_name)
+                        if existing_db is not None:
+                            temp_name = f"__QAM_EXTRACT_TEMP_{asset_name}_{id(existing_db)}"
+                            original_name = existing_db.name
+                            existing_db.name = temp_name
+                            renamed_existing.append((existing_db, original_name))
+
+                    setattr(data_to, target_collection, [asset_name])
             
             if not target_collection:
                 print(f"Asset '{asset_name}' not found in {src_path.name}")
                 return False
             
-            renamed_existing = []
-            if hasattr(bpy.data, target_collection):
-                collection = getattr(bpy.data, target_collection)
-                if asset_name in collection:
-                    existing_db = collection[asset_name]
-                    temp_name = f"__QAM_EXTRACT_TEMP_{asset_name}_{id(existing_db)}"
-                    original_name = existing_db.name
-                    existing_db.name = temp_name
-                    renamed_existing.append((existing_db, original_name))
-            
-            with bpy.data.libraries.load(str(src_path), link=False, assets_only=False) as (data_from, data_to):
-                setattr(data_to, target_collection, [asset_name])
-            
-            target_db = None
-            if hasattr(bpy.data, target_collection):
-                collection = getattr(bpy.data, target_collection)
-                if asset_name in collection:
-                    target_db = collection[asset_name]
+            target_db = collection.get(asset_name) if collection is not None else None
             
             if not target_db or not target_db.asset_data:
                 if target_db:
@@ -751,44 +767,49 @@ class QAM_OT_move_selected_to_library(Operator):
         try:
             # Use ALL datablock collections to preserve complete file contents
             names_to_import = {}
+            renamed_existing = []
+            # Single load: list the names, move clashing local datablocks
+            # aside, then request everything. data_to is only read when the
+            # block exits, so the renames land before the import.
             with bpy.data.libraries.load(str(src_path), link=False, assets_only=False) as (data_from, data_to):
+                # One dir() probe instead of a hasattr() per collection name
+                available = set(dir(data_from))
                 for collection_name in ALL_DATABLOCK_COLLECTIONS:
-                    if hasattr(data_from, collection_name):
+                    if collection_name in available:
                         source = getattr(data_from, collection_name)
                         if source:
                             names_to_import[collection_name] = list(source)
-            
-            renamed_existing = []
-            for collection_name, names in names_to_import.items():
-                if hasattr(bpy.data, collection_name):
-                    collection = getattr(bpy.data, collection_name)
-                    for name in names:
-                        if name in collection:
-                            existing_db = collection[name]
+
+                # Resolve each bpy.data collection once and share it between
+                # the rename pass and the post-import pass below
+                local_collections = {
+                    collection_name: getattr(bpy.data, collection_name)
+                    for collection_name in names_to_import
+                    if collection_name in BLEND_DATA_COLLECTIONS
+                }
+
+                for collection_name, collection in local_collections.items():
+                    for name in names_to_import[collection_name]:
+                        existing_db = collection.get(name)
+                        if existing_db is not None:
                             temp_name = f"__QAM_MOVE_TEMP_{name}_{id(existing_db)}"
                             original_name = existing_db.name
                             existing_db.name = temp_name
                             renamed_existing.append((existing_db, original_name))
-            
-            with bpy.data.libraries.load(str(src_path), link=False, assets_only=False) as (data_from, data_to):
-                for collection_name in ALL_DATABLOCK_COLLECTIONS:
-                    if hasattr(data_from, collection_name):
-                        source = getattr(data_from, collection_name)
-                        if source:
-                            setattr(data_to, collection_name, list(source))
+
+                for collection_name, names in names_to_import.items():
+                    setattr(data_to, collection_name, list(names))
             
             imported_datablocks = set()
-            for collection_name in names_to_import.keys():
-                if hasattr(bpy.data, collection_name):
-                    collection = getattr(bpy.data, collection_name)
-                    for name in names_to_import[collection_name]:
-                        if name in collection:
-                            db = collection[name]
-                            imported_datablocks.add(db)
-                            
-                            # Only clear asset status on the extracted asset
-                            if name == asset_name and hasattr(db, 'asset_clear'):
-                                db.asset_clear()
+            for collection_name, collection in local_collections.items():
+                for name in names_to_import[collection_name]:
+                    db = collection.get(name)
+                    if db is not None:
+                        imported_datablocks.add(db)
+                        
+                        # Only clear asset status on the extracted asset
+                        if name == asset_name and hasattr(db, 'asset_clear'):
+                            db.asset_clear()
             
             temp_path = src_path.parent / f".tmp_{src_path.name}"
             bpy.data.libraries.write(
@@ -834,61 +855,79 @@ class QAM_OT_move_selected_to_library(Operator):
         Returns:
             bool: True if successful
         """
+        # Set once, so each imported name is matched without a list scan
+        if target_names is not None:
+            target_names = set(target_names)
+
         try:
             # Use ALL datablock collections to preserve complete file contents
             names_to_import = {}
+            renamed_existing = []
+            # Single load: list the names, move clashing local datablocks
+            # aside, then request everything. data_to is only read when the
+            # block exits, so the renames land before the import.
             with bpy.data.libraries.load(str(blend_path), link=False, assets_only=False) as (data_from, data_to):
+                # One dir() probe instead of a hasattr() per collection name
+                available = set(dir(data_from))
                 for collection_name in ALL_DATABLOCK_COLLECTIONS:
-                    if hasattr(data_from, collection_name):
+                    if collection_name in available:
                         source = getattr(data_from, collection_name)
                         if source:
                             names_to_import[collection_name] = list(source)
-            
-            renamed_existing = []
-            for collection_name, names in names_to_import.items():
-                if hasattr(bpy.data, collection_name):
-                    collection = getattr(bpy.data, collection_name)
-                    for name in names:
-                        if name in collection:
-                            existing_db = collection[name]
+
+                # Resolve each bpy.data collection once and share it between
+                # the rename pass and the post-import pass below
+                local_collections = {
+                    collection_name: getattr(bpy.data, collection_name)
+                    for collection_name in names_to_import
+                    if collection_name in BLEND_DATA_COLLECTIONS
+                }
+
+                for collection_name, collection in local_collections.items():
+                    for name in names_to_import[collection_name]:
+                        existing_db = collection.get(name)
+                        if existing_db is not None:
                             temp_name = f"__QAM_CAT_TEMP_{name}_{id(existing_db)}"
                             original_name = existing_db.name
                             existing_db.name = temp_name
                             renamed_existing.append((existing_db, original_name))
+
+                for collection_name, names in names_to_import.items():
+                    setattr(data_to, collection_name, list(names))
             
-            with bpy.data.libraries.load(str(blend_path), link=False, assets_only=False) as (data_from, data_to):
-                for collection_name in ALL_DATABLOCK_COLLECTIONS:
-                    if hasattr(data_from, collection_name):
-                        source = getattr(data_from, collection_name)
-                        if source:
-                            setattr(data_to, collection_name, list(source))
+            # Use null UUID for Unassigned, otherwise use the provided UUID
+            # Blender uses "00000000-0000-0000-0000-000000000000" for unassigned
+            if catalog_uuid == "" or catalog_uuid is None:
+                new_catalog_id = "00000000-0000-0000-0000-000000000000"
+            else:
+                new_catalog_id = catalog_uuid
             
             imported_datablocks = set()
-            for collection_name in names_to_import.keys():
-                if hasattr(bpy.data, collection_name):
-                    collection = getattr(bpy.data, collection_name)
-                    for name in names_to_import[collection_name]:
-                        if name in collection:
-                            db = collection[name]
-                            imported_datablocks.add(db)
-                            
-                            # Only update catalog on asset datablocks
-                            if hasattr(db, 'asset_data') and db.asset_data:
-                                if target_names is None or name in target_names:
-                                    # Use null UUID for Unassigned, otherwise use the provided UUID
-                                    # Blender uses "00000000-0000-0000-0000-000000000000" for unassigned
-                                    if catalog_uuid == "" or catalog_uuid is None:
-                                        db.asset_data.catalog_id = "00000000-0000-0000-0000-000000000000"
-                                    else:
-                                        db.asset_data.catalog_id = catalog_uuid
-            
-            if not imported_datablocks:
+            catalog_changed = False
+            for collection_name, collection in local_collections.items():
+                for name in names_to_import[collection_name]:
+                    db = collection.get(name)
+                    if db is not None:
+                        imported_datablocks.add(db)
+                        
+                        # Only update catalog on asset datablocks
+                        if hasattr(db, 'asset_data') and db.asset_data:
+                            if target_names is None or name in target_names:
+                                if db.asset_data.catalog_id != new_catalog_id:
+                                    db.asset_data.catalog_id = new_catalog_id
+                                    catalog_changed = True
+            
+            if not imported_datablocks or not catalog_changed:
+                # Nothing imported, or every asset is already in the target
+                # catalog - either way there is nothing to write back
+                for db in list(imported_datablocks):
+                    self._remove_datablock(db)
                 for existing_db, original_name in renamed_existing:
                     try:
                         existing_db.name = original_name
                     except Exception:
                         pass
-                return False
+                return bool(imported_datablocks)
             
             temp_path = blend_path.parent / f".tmp_{blend_path.name}"
             bpy.data.libraries.write(
@@ -907,11 +946,9 @@ class QAM_OT_move_selected_to_library(Operator):
                 except Exception:
                     pass
             
-            if temp_path.exists():
-                if blend_path.exists():
-                    blend_path.unlink()
-                shutil.move(str(temp_path), str(blend_path))
-                return True
+            # Atomic swap: a crash can never leave the asset without its .blend
+            os.replace(str(temp_path), str(blend_path))
+            return True
                 
         except (RuntimeError, IOError, OSError) as e:
             print(f"Failed to update catalog in {blend_path.name}: {e}")
@@ -2,6 +2,7 @@
 Save asset operator for Quick Asset Saver.
 """
 
+import os
 import time
 from pathlib import Path
 
@@ -230,11 +231,9 @@ class QAM_OT_save_asset_to_library_direct(Operator):
                     self.report({"ERROR"}, f"Could not create catalog subfolder: {e}")
                     return {"CANCELLED"}
 
-        try:
-            test_file = target_dir / ".write_test"
-            test_file.touch()
-            test_file.unlink()
-        except (OSError, PermissionError):
+        # Permission check without touching the filesystem; any remaining
+        # failure (e.g. a full disk) is reported by write_blend_file below.
+        if not os.access(target_dir, os.W_OK):
             self.report({"ERROR"}, f"Target path is not writable: {target_dir}")
             return {"CANCELLED"}
 
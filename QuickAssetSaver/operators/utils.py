@@ -2,6 +2,7 @@
 Utility functions for Quick Asset Saver operators.
 """
 
+import os
 import re
 from pathlib import Path
 
@@ -13,10 +14,27 @@ from ..constants import (
     LARGE_SELECTION_WARNING_THRESHOLD,  # noqa: F401 (re-exported for bundle.py)
     VERY_LARGE_BUNDLE_WARNING_MB,  # noqa: F401 (re-exported for bundle.py)
     DEFAULT_MAX_BUNDLE_SIZE_MB,  # noqa: F401 (re-exported for bundle.py)
+    COMPANION_FOLDER_GROUPS,
+    THUMBNAIL_EXTENSIONS,
+    METADATA_EXTENSIONS,
 )
 
 DEBUG_MODE = bpy.app.debug
 
+# Companion-matching tables, normcased once at import so per-file work is
+# limited to the few names that depend on the asset's stem
+_THUMBNAIL_EXTENSIONS = tuple(os.path.normcase(ext) for ext in THUMBNAIL_EXTENSIONS)
+_GENERIC_THUMBNAIL_NAMES = frozenset(f"thumbnail{ext}" for ext in _THUMBNAIL_EXTENSIONS)
+_METADATA_SUFFIXES = tuple(os.path.normcase(ext) for ext in METADATA_EXTENSIONS)
+_COMPANION_FOLDER_GROUPS = tuple(
+    tuple(dict.fromkeys(os.path.normcase(name) for name in group))
+    for group in COMPANION_FOLDER_GROUPS
+)
+
+# Library files companion matching must never pick up, normcased like the
+# names they are compared against
+PROTECTED_FILENAMES = frozenset({os.path.normcase('blender_assets.cats.txt')})
+
 # Complete list of all Blender datablock collection names that can contain user data.
 # Used when loading/writing .blend files to preserve ALL data in the file.
 # Note: Not all of these exist in all Blender versions.
@@ -76,6 +94,15 @@ ASSET_DATABLOCK_COLLECTIONS = [
     'worlds',
 ]
 
+# Names from ALL_DATABLOCK_COLLECTIONS that bpy.data actually exposes in the
+# running Blender version. Resolved once from the RNA type (not bpy.data
+# itself, which is restricted during registration and replaced on file load),
+# so per-file loops can skip hasattr() probes into RNA.
+BLEND_DATA_COLLECTIONS = frozenset(
+    name for name in ALL_DATABLOCK_COLLECTIONS
+    if name in bpy.types.BlendData.bl_rna.properties.keys()
+)
+
 
 def debug_print(*args, **kwargs):
     """Print debug messages only when DEBUG_MODE is enabled."""
@@ -250,3 +277,159 @@ def increment_filename(base_path, name, extension=".blend"):
         f"Too many incremental files for '{name}' (exceeded {MAX_INCREMENTAL_FILES}). "
         "Please clean up old versions or use a different name."
     )
+
+
+def scan_existing_filenames(base_path):
+    """
+    Collect the names of all entries in a directory with a single scandir.
+
+    Names are normalised with os.path.normcase so lookups follow the
+    platform's case sensitivity (e.g. Asset.blend vs asset.blend on Windows).
+
+    Args:
+        base_path (Path or str): Directory to scan
+
+    Returns:
+        set: Normalised entry names, empty if the directory can't be read
+    """
+    try:
+        with os.scandir(base_path) as entries:
+            return {os.path.normcase(entry.name) for entry in entries}
+    except OSError:
+        return set()
+
+
+def increment_filename_from_set(base_path, name, extension, existing):
+    """
+    Generate an incremented filename using a pre-scanned set of names.
+
+    Same naming scheme as increment_filename (name_001, name_002, ...) but
+    checks candidates against an in-memory set instead of the filesystem,
+    so resolving many conflicts in one folder costs no extra stat calls.
+    The returned name is added to the set so later conflicts in the same
+    batch don't pick it again.
+
+    Args:
+        base_path (Path or str): Directory path where file will be saved
+        name (str): Base filename without extension
+        extension (str): File extension including dot
+        existing (set): Names from scan_existing_filenames(); updated in place
+
+    Returns:
+        Path: Full path with incremented filename if needed
+
+    Raises:
+        RuntimeError: If more than MAX_INCREMENTAL_FILES versions exist
+        ValueError: If name is empty
+    """
+    if not name or not isinstance(name, str):
+        raise ValueError("Name must be a non-empty string")
+
+    base_path = Path(base_path)
+
+    candidate = f"{name}{extension}"
+    if os.path.normcase(candidate) not in existing:
+        existing.add(os.path.normcase(candidate))
+        return base_path / candidate
+
+    for counter in range(1, MAX_INCREMENTAL_FILES + 1):
+        candidate = f"{name}_{counter:03d}{extension}"
+        if os.path.normcase(candidate) not in existing:
+            existing.add(os.path.normcase(candidate))
+            return base_path / candidate
+
+    raise RuntimeError(
+        f"Too many incremental files for '{name}' (exceeded {MAX_INCREMENTAL_FILES}). "
+        "Please clean up old versions or use a different name."
+    )
+
+
+def scan_companion_folder(folder):
+    """List a folder once for companion matching.
+
+    DirEntry caches the file type, so classifying entries needs no further
+    stat() calls. Names are normcased so matching follows the platform's
+    case sensitivity, as exists()/glob() probes would.
+
+    Returns:
+        list: (normcased name, path, is_dir, is_file) per entry, or None if
+        the folder can't be read
+    """
+    normcase = os.path.normcase
+    try:
+        with os.scandir(folder) as entries:
+            return [
+                (normcase(entry.name), entry.path, entry.is_dir(), entry.is_file())
+                for entry in entries
+            ]
+    except OSError as e:
+        debug_print(f"Could not scan {folder} for companions: {e}")
+        return None
+
+
+def collect_companions_for_file(blend_path, folder_listing=None):
+    """Find companion files for a .blend file that should go to the recycle bin.
+    
+    Collects:
+    - Thumbnails: {stem}.png, thumbnail.webp, etc.
+    - Common asset folders: textures/, maps/, materials/, etc.
+    - Asset-named subfolders: {stem}/
+    - Metadata files: *.json, *.txt, *.md, *.xml
+    
+    Args:
+        blend_path: Path of the .blend file
+        folder_listing: Result of scan_companion_folder() for the file's
+            folder, so files sharing a folder share one scan; scanned here
+            if not given
+
+    Returns:
+        list: Absolute path strings of the companion items
+    """
+    # Plain strings throughout: DirEntry.path is already the joined path
+    blend_path = os.fspath(blend_path)
+    items_to_trash = []
+    
+    stem = os.path.splitext(os.path.basename(blend_path))[0]
+    parent = os.path.dirname(blend_path)
+
+    if folder_listing is None:
+        folder_listing = scan_companion_folder(parent)
+    if folder_listing is None:
+        return []
+
+    norm_stem = os.path.normcase(stem)
+    thumbnail_names = _GENERIC_THUMBNAIL_NAMES.union(
+        f"{norm_stem}{ext}" for ext in _THUMBNAIL_EXTENSIONS
+    )
+
+    # One directory listing answers every companion check
+    folders = {}
+    metadata = []
+    for name, path, is_dir, is_file in folder_listing:
+        if name in thumbnail_names:
+            items_to_trash.append(path)
+        elif is_dir:
+            folders[name] = path
+        elif (
+            is_file
+            and name.endswith(_METADATA_SUFFIXES)
+            and name not in PROTECTED_FILENAMES  # NEVER touch catalog files!
+        ):
+            metadata.append(path)
+
+    # Collect common asset companion folders - only one folder per group
+    for folder_group in _COMPANION_FOLDER_GROUPS:
+        for folder_name in folder_group:
+            folder_path = folders.pop(folder_name, None)
+            if folder_path is not None:
+                items_to_trash.append(folder_path)
+                break
+
+    # Collect asset-named subfolder
+    asset_folder = folders.get(norm_stem)
+    if asset_folder is not None:
+        items_to_trash.append(asset_folder)
+
+    items_to_trash.extend(metadata)
+
+    return items_to_trash
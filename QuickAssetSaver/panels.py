@@ -284,6 +284,7 @@ class QAM_PT_bulk_operations(bpy.types.Panel):
         box.prop(bundler_props, "save_path", text="Path")
         box.prop(bundler_props, "duplicate_mode", text="Overwrite")
         box.prop(bundler_props, "copy_catalog")
+        box.prop(bundler_props, "compress_bundle")
         
         row = box.row()
         row.scale_y = 1.2
@@ -457,16 +457,25 @@ def _migrate_old_library_format(addon_prefs, preferences):
         print(f"Warning during library format migration: {e}")
 
 
+# Old-format library settings only exist in preferences saved by older
+# versions, so the migration only needs to run once per session
+_library_format_migrated = False
+
+
 def get_addon_preferences(context=None):
     # Auto-initializes default library if none selected
-    # Performs automatic migration from old formats
+    # Performs automatic migration from old formats (once per session)
+    global _library_format_migrated
+
     if context is None:
         context = bpy.context
 
     preferences = context.preferences
     addon_prefs = preferences.addons[__package__].preferences
 
-    _migrate_old_library_format(addon_prefs, preferences)
+    if not _library_format_migrated:
+        _migrate_old_library_format(addon_prefs, preferences)
+        _library_format_migrated = True
 
     if (
         not addon_prefs.selected_library
@@ -500,11 +509,16 @@ class QAMBundlerProperties(PropertyGroup):
         default="AssetBundle",
     )
 
+    def _update_save_path(self, context):
+        from .operators.bundle import clear_path_check_cache
+        clear_path_check_cache()
+
     save_path: StringProperty(
         name="Save Path",
         description="Directory where the bundle will be saved",
         default="",
         subtype="DIR_PATH",
+        update=_update_save_path,
     )
 
     duplicate_mode: EnumProperty(
@@ -531,6 +545,12 @@ class QAMBundlerProperties(PropertyGroup):
         default=True,
     )
 
+    compress_bundle: BoolProperty(
+        name="Compress Bundle",
+        description="Compress the bundle file (smaller on disk, but much slower to save large bundles)",
+        default=False,
+    )
+
     show_success_message: BoolProperty(
         name="Show Success Message",
         description="Internal flag to show thank you message after bundle",
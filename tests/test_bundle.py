@@ -0,0 +1,185 @@
+"""
+Tests for the bundle operator (bundle.py): duplicate filtering of the
+selection and the import run.
+
+The import/cancel/finish steps are driven directly, the way invoke() and
+modal() drive them, on .blend files written by write_blend_file.
+"""
+import shutil
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+import bpy
+from QuickAssetSaver.operators.bundle import (
+    HEAD_HASH_BYTES,
+    QAM_OT_bundle_assets,
+    _drop_duplicate_files,
+    _prefetch_worker,
+)
+from QuickAssetSaver.operators.file_io import write_blend_file
+from tests.fixtures import make_test_asset, remove_test_asset
+
+
+class TestDropDuplicateFiles(unittest.TestCase):
+    """Look-alike files (same name and size) in different folders of a library."""
+
+    SIZE = HEAD_HASH_BYTES * 2
+
+    def setUp(self):
+        self._tmpdir = tempfile.mkdtemp(prefix="qam_dedup_test_")
+
+    def tearDown(self):
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def _write(self, folder, data, name="rock.blend"):
+        path = Path(self._tmpdir) / folder / name
+        path.parent.mkdir(exist_ok=True)
+        path.write_bytes(data)
+        return (path, len(data))
+
+    def test_same_size_different_head_kept(self):
+        a = self._write("a", b"A" * self.SIZE)
+        b = self._write("b", b"B" * self.SIZE)
+        kept, dropped = _drop_duplicate_files([a, b])
+        self.assertEqual(kept, [a, b])
+        self.assertEqual(dropped, [])
+
+    def test_same_head_different_tail_kept(self):
+        head = b"H" * HEAD_HASH_BYTES
+        a = self._write("a", head + b"A" * HEAD_HASH_BYTES)
+        b = self._write("b", head + b"B" * HEAD_HASH_BYTES)
+        kept, dropped = _drop_duplicate_files([a, b])
+        self.assertEqual(kept, [a, b])
+        self.assertEqual(dropped, [])
+
+    def test_true_duplicates_dropped(self):
+        data = b"H" * HEAD_HASH_BYTES + b"T" * HEAD_HASH_BYTES
+        a = self._write("a", data)
+        b = self._write("b", data)
+        c = self._write("c", data)
+        kept, dropped = _drop_duplicate_files([a, b, c])
+        self.assertEqual(kept, [a])
+        self.assertEqual(dropped, [(b[0], a[0]), (c[0], a[0])])
+
+    def test_small_duplicates_dropped_on_head_hash(self):
+        a = self._write("a", b"small")
+        b = self._write("b", b"small")
+        kept, dropped = _drop_duplicate_files([a, b])
+        self.assertEqual(kept, [a])
+        self.assertEqual(dropped, [(b[0], a[0])])
+
+    def test_same_content_different_name_kept(self):
+        data = b"D" * self.SIZE
+        a = self._write("a", data, name="rock.blend")
+        b = self._write("b", data, name="stone.blend")
+        kept, dropped = _drop_duplicate_files([a, b])
+        self.assertEqual(kept, [a, b])
+        self.assertEqual(dropped, [])
+
+
+class _BundleRun:
+    """The operator's import-run methods, callable without registering it."""
+    bl_label = QAM_OT_bundle_assets.bl_label
+    _import_next = QAM_OT_bundle_assets._import_next
+    _import_asset_file = QAM_OT_bundle_assets._import_asset_file
+    _discard_imported = QAM_OT_bundle_assets._discard_imported
+    _end_import = QAM_OT_bundle_assets._end_import
+    _finish_bundle = QAM_OT_bundle_assets._finish_bundle
+    _log = QAM_OT_bundle_assets._log
+    _flush_log = QAM_OT_bundle_assets._flush_log
+    cancel = QAM_OT_bundle_assets.cancel
+
+    def __init__(self, queue, target_path):
+        # Same run state _begin_bundle sets up
+        self.reports = []
+        self._timer = None
+        self._log_buf = []
+        self._queue = queue
+        self._imported_ids = []
+        self._next_index = 0
+        self._next_progress_time = 0.0
+        self._imported_count = 0
+        self._skipped_count = 0
+        self._error_count = 0
+        self._existing_names = None
+        self._target_path = target_path
+        self._library_path = target_path.parent
+        self._output_name = target_path.stem
+        self._prefetch_slots = threading.Semaphore(2)
+        self._prefetch_stop = threading.Event()
+        self._prefetcher = threading.Thread(
+            target=_prefetch_worker,
+            args=(queue, self._prefetch_slots, self._prefetch_stop),
+            daemon=True,
+        )
+        self._prefetcher.start()
+
+    def report(self, level, message):
+        self.reports.append((level, message))
+
+
+def _make_context():
+    """Stand-in context: a window manager that records progress/timer calls."""
+    props = SimpleNamespace(
+        compress_bundle=False,
+        copy_catalog=False,
+        show_success_message=False,
+        success_message_time=0.0,
+    )
+    wm = mock.MagicMock()
+    wm.qam_bundler_props = props
+    return SimpleNamespace(window_manager=wm)
+
+
+class TestBundleImportRun(unittest.TestCase):
+    NAMES = ("QAM_BundleA", "QAM_BundleB")
+
+    def setUp(self):
+        self._tmpdir = tempfile.mkdtemp(prefix="qam_bundle_test_")
+        self.queue = []
+        for name in self.NAMES:
+            obj = make_test_asset(name=name)
+            path = Path(self._tmpdir) / f"{name}.blend"
+            write_blend_file(path, {obj})
+            remove_test_asset(obj)
+            self.queue.append(path)
+        self.target = Path(self._tmpdir) / "out" / "bundle.blend"
+        self.target.parent.mkdir()
+
+    def tearDown(self):
+        for name in self.NAMES:
+            obj = bpy.data.objects.get(name)
+            if obj is not None:
+                remove_test_asset(obj)
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def test_cancel_partway_removes_imported_ids(self):
+        run = _BundleRun(self.queue, self.target)
+        context = _make_context()
+        run._import_next(context)
+        self.assertIn("QAM_BundleA", bpy.data.objects)
+
+        run.cancel(context)
+
+        self.assertNotIn("QAM_BundleA", bpy.data.objects)
+        self.assertNotIn("QAM_BundleB", bpy.data.objects)
+        self.assertIsNone(run._imported_ids)
+        self.assertIsNone(run._log_buf)
+        self.assertFalse(run._prefetcher.is_alive())
+
+    def test_finish_without_window_still_succeeds(self):
+        """Background runs can't push undo: the saved bundle must still report success."""
+        run = _BundleRun(self.queue, self.target)
+        context = _make_context()
+        while run._import_next(context):
+            pass
+        run._end_import(context)
+
+        self.assertEqual(run._finish_bundle(context), {"FINISHED"})
+        self.assertTrue(self.target.exists())
+        self.assertIn("QAM_BundleA", bpy.data.objects)
+        self.assertIn("QAM_BundleB", bpy.data.objects)
@@ -1,4 +1,5 @@
 """Tests for catalog CDF read/write operations."""
+import os
 import unittest
 import uuid
 from QuickAssetSaver.operators.catalog import (
@@ -6,8 +7,9 @@ from QuickAssetSaver.operators.catalog import (
     get_catalog_path_from_uuid,
     create_catalog_entry,
     clear_catalog_cache,
+    clear_and_set_tags,
 )
-from tests.fixtures import TempLibrary
+from tests.fixtures import TempLibrary, make_test_asset, remove_test_asset
 
 
 class TestGetCatalogsFromCdf(unittest.TestCase):
@@ -126,6 +128,16 @@ class TestGetCatalogPathFromUuid(unittest.TestCase):
             result = get_catalog_path_from_uuid(str(lib.path), str(uuid.uuid4()))
             self.assertIsNone(result)
 
+    def test_picks_up_cdf_changes_without_manual_clear(self):
+        u = str(uuid.uuid4())
+        with TempLibrary() as lib:
+            self.assertIsNone(get_catalog_path_from_uuid(str(lib.path), u))
+            lib.cdf_path.write_text(f"VERSION 1\n\n{u}:Props:Props\n", encoding="utf-8")
+            # Make sure the mtime differs even on coarse-grained filesystems
+            st = lib.cdf_path.stat()
+            os.utime(lib.cdf_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+            self.assertEqual(get_catalog_path_from_uuid(str(lib.path), u), "Props")
+
 
 class TestCreateCatalogEntry(unittest.TestCase):
     def setUp(self):
@@ -193,3 +205,36 @@ class TestCreateCatalogEntry(unittest.TestCase):
             catalogs, _ = get_catalogs_from_cdf(str(lib.path))
             self.assertIn("Materials", catalogs)
             self.assertIn("Characters", catalogs)
+
+
+class TestClearAndSetTags(unittest.TestCase):
+    def setUp(self):
+        self.obj = make_test_asset(name="QAM_TagTest")
+
+    def tearDown(self):
+        remove_test_asset(self.obj)
+
+    def _tag_names(self):
+        return [tag.name for tag in self.obj.asset_data.tags]
+
+    def test_sets_tags_in_order(self):
+        clear_and_set_tags(self.obj.asset_data, "metal, shiny, chrome")
+        self.assertEqual(self._tag_names(), ["metal", "shiny", "chrome"])
+
+    def test_replaces_existing_tags(self):
+        self.obj.asset_data.tags.new("old")
+        clear_and_set_tags(self.obj.asset_data, "new")
+        self.assertEqual(self._tag_names(), ["new"])
+
+    def test_skips_empty_and_duplicate_tags(self):
+        clear_and_set_tags(self.obj.asset_data, "metal, , metal,shiny")
+        self.assertEqual(self._tag_names(), ["metal", "shiny"])
+
+    def test_accepts_newline_separators(self):
+        clear_and_set_tags(self.obj.asset_data, "metal\nshiny")
+        self.assertEqual(self._tag_names(), ["metal", "shiny"])
+
+    def test_empty_string_clears_tags(self):
+        self.obj.asset_data.tags.new("old")
+        clear_and_set_tags(self.obj.asset_data, "")
+        self.assertEqual(self._tag_names(), [])
@@ -0,0 +1,86 @@
+"""
+Tests for moving a .blend file with its companions (move.py).
+
+Send2Trash is replaced with a recorder that removes the paths itself, so
+the tests see exactly what would have gone to the recycle bin without
+touching the real one.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from QuickAssetSaver.operators.move import QAM_OT_move_selected_to_library
+
+
+class _MoveHelpers:
+    """The operator's file-moving methods, callable without registering it."""
+    _has_companion_files = QAM_OT_move_selected_to_library._has_companion_files
+    _move_file_with_companions = QAM_OT_move_selected_to_library._move_file_with_companions
+    _copy_companion_files = QAM_OT_move_selected_to_library._copy_companion_files
+    _trash_source_with_companions = QAM_OT_move_selected_to_library._trash_source_with_companions
+
+
+class TestMoveFileWithCompanions(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.mkdtemp(prefix="qam_move_test_")
+        root = Path(self._tmpdir)
+        self.src_dir = root / "src"
+        self.dest_dir = root / "dest"
+        self.src_dir.mkdir()
+        self.dest_dir.mkdir()
+
+        self.src = self.src_dir / "rock.blend"
+        self.src.write_bytes(b"BLENDER" + b"\0" * 200)
+        (self.src_dir / "rock.png").write_bytes(b"png")
+        (self.src_dir / "rock.json").write_text("{}", encoding="utf-8")
+        (self.src_dir / "blender_assets.cats.txt").write_text("VERSION 1\n", encoding="utf-8")
+
+        self.trashed = []
+        patchers = [
+            mock.patch("QuickAssetSaver.operators.move.move_many_to_trash", self._fake_trash_many),
+            mock.patch("QuickAssetSaver.operators.move.move_to_trash", self._fake_trash),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def _fake_trash(self, path):
+        path = Path(path)
+        self.trashed.append(os.path.normcase(path.name))
+        if path.is_dir():
+            shutil.rmtree(path)
+        else:
+            path.unlink()
+
+    def _fake_trash_many(self, paths):
+        for path in paths:
+            self._fake_trash(path)
+
+    def test_move_copies_blend_and_companions(self):
+        dest = self.dest_dir / "rock.blend"
+        self.assertTrue(
+            _MoveHelpers()._move_file_with_companions(self.src, dest, ["rock"], None)
+        )
+        self.assertTrue((self.dest_dir / "rock" / "rock.blend").exists())
+        self.assertTrue((self.dest_dir / "rock" / "rock.png").exists())
+        self.assertTrue((self.dest_dir / "rock" / "rock.json").exists())
+
+    def test_move_trashes_source_and_companions(self):
+        dest = self.dest_dir / "rock.blend"
+        _MoveHelpers()._move_file_with_companions(self.src, dest, ["rock"], None)
+        for name in ("rock.blend", "rock.png", "rock.json"):
+            self.assertIn(os.path.normcase(name), self.trashed)
+            self.assertFalse((self.src_dir / name).exists())
+
+    def test_move_keeps_catalog_file(self):
+        dest = self.dest_dir / "rock.blend"
+        _MoveHelpers()._move_file_with_companions(self.src, dest, ["rock"], None)
+        self.assertNotIn(os.path.normcase("blender_assets.cats.txt"), self.trashed)
+        self.assertTrue((self.src_dir / "blender_assets.cats.txt").exists())
+
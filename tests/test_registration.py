@@ -91,6 +91,9 @@ class TestBundlerPropsFields(unittest.TestCase):
     def test_has_copy_catalog(self):
         self.assertTrue(hasattr(self.props, "copy_catalog"))
 
+    def test_compress_bundle_defaults_off(self):
+        self.assertFalse(self.props.compress_bundle)
+
 
 class TestManagePropsFields(unittest.TestCase):
     def setUp(self):
@@ -9,11 +9,13 @@ We test this in three layers:
   1. The fallback function itself — raises, doesn't delete
   2. The real move_to_trash is callable from both delete and move modules
   3. When Send2Trash IS available it successfully moves a real file
+  4. A failed batch is retried per item and each failure is reported
 """
 
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
@@ -156,3 +158,80 @@ class TestMoveToTrashRealBehavior(unittest.TestCase):
         bad_path = str(Path(self._tmpdir) / "does_not_exist.blend")
         with self.assertRaises(Exception):
             move_to_trash(bad_path)
+
+    def test_batched_trash_does_not_permanently_delete(self):
+        """move_many_to_trash must either trash every file or raise and leave them all."""
+        from QuickAssetSaver.operators.delete import move_many_to_trash
+
+        test_files = [Path(self._tmpdir) / f"qam_batch_{i}.blend" for i in range(3)]
+        for test_file in test_files:
+            test_file.touch()
+
+        try:
+            move_many_to_trash([str(f) for f in test_files])
+        except RuntimeError as e:
+            self.assertIn("NOT deleted", str(e))
+            for test_file in test_files:
+                self.assertTrue(test_file.exists(),
+                    "Fallback raised RuntimeError but a file was deleted — safety violation")
+        else:
+            for test_file in test_files:
+                self.assertFalse(test_file.exists())
+
+
+class TestTrashBatchFallback(unittest.TestCase):
+    """
+    When the batched send2trash call fails, _trash_batch retries each item
+    on its own: the items that can be trashed still are, and only the
+    failing one is reported.
+    """
+
+    def setUp(self):
+        self._tmpdir = tempfile.mkdtemp(prefix="qam_batch_retry_")
+        self.files = [Path(self._tmpdir) / f"qam_retry_{i}.blend" for i in range(3)]
+        for test_file in self.files:
+            test_file.touch()
+        self.locked = self.files[1]
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def _fail_batch(self, paths):
+        raise OSError("batch failed")
+
+    def _trash_one(self, path):
+        # Stands in for send2trash: "trashes" by removing, but one file is locked
+        if Path(path) == self.locked:
+            raise PermissionError(f"'{Path(path).name}' is locked")
+        Path(path).unlink()
+
+    def _run_batch(self, has_send2trash=True):
+        from QuickAssetSaver.operators import delete
+        with mock.patch.object(delete, "_HAS_SEND2TRASH", has_send2trash), \
+                mock.patch.object(delete, "move_many_to_trash", self._fail_batch), \
+                mock.patch.object(delete, "move_to_trash", self._trash_one):
+            return delete._trash_batch([str(f) for f in self.files])
+
+    def test_other_items_still_trashed(self):
+        results = self._run_batch()
+        self.assertEqual([success for success, _ in results], [True, False, True])
+        self.assertFalse(self.files[0].exists())
+        self.assertFalse(self.files[2].exists())
+
+    def test_failed_item_reported_and_kept(self):
+        results = self._run_batch()
+        success, error = results[1]
+        self.assertFalse(success)
+        self.assertIsInstance(error, PermissionError)
+        self.assertIn(self.locked.name, str(error))
+        self.assertTrue(self.locked.exists())
+
+    def test_without_send2trash_nothing_is_retried_or_deleted(self):
+        results = self._run_batch(has_send2trash=False)
+        self.assertEqual(len(results), len(self.files))
+        for success, error in results:
+            self.assertFalse(success)
+            self.assertIsInstance(error, OSError)
+        for test_file in self.files:
+            self.assertTrue(test_file.exists())
@@ -1,4 +1,5 @@
 """Tests for QuickAssetSaver/operators/utils.py"""
+import os
 import unittest
 import tempfile
 from pathlib import Path
@@ -6,6 +7,12 @@ from QuickAssetSaver.operators.utils import (
     sanitize_name,
     build_asset_filename,
     increment_filename,
+    increment_filename_from_set,
+    scan_existing_filenames,
+    scan_companion_folder,
+    collect_companions_for_file,
+    ALL_DATABLOCK_COLLECTIONS,
+    BLEND_DATA_COLLECTIONS,
 )
 from tests.fixtures import MockPrefs
 
@@ -146,3 +153,100 @@ class TestIncrementFilename(unittest.TestCase):
             # Should accept string paths too
             result = increment_filename(d, "asset", ".blend")
             self.assertIsInstance(result, Path)
+
+
+class TestIncrementFilenameFromSet(unittest.TestCase):
+    def test_scan_collects_names(self):
+        with tempfile.TemporaryDirectory() as d:
+            p = Path(d)
+            (p / "asset.blend").touch()
+            (p / "textures").mkdir()
+            names = scan_existing_filenames(p)
+            self.assertIn(os.path.normcase("asset.blend"), names)
+            self.assertIn(os.path.normcase("textures"), names)
+
+    def test_scan_missing_dir_returns_empty(self):
+        with tempfile.TemporaryDirectory() as d:
+            self.assertEqual(scan_existing_filenames(Path(d) / "missing"), set())
+
+    def test_no_conflict_returns_base(self):
+        existing = set()
+        result = increment_filename_from_set("/lib", "asset", ".blend", existing)
+        self.assertEqual(result.name, "asset.blend")
+
+    def test_matches_increment_filename(self):
+        with tempfile.TemporaryDirectory() as d:
+            p = Path(d)
+            (p / "asset.blend").touch()
+            (p / "asset_001.blend").touch()
+            existing = scan_existing_filenames(p)
+            result = increment_filename_from_set(p, "asset", ".blend", existing)
+            self.assertEqual(result, increment_filename(p, "asset", ".blend"))
+
+    def test_chosen_name_is_reserved(self):
+        existing = {os.path.normcase("asset.blend")}
+        first = increment_filename_from_set("/lib", "asset", ".blend", existing)
+        second = increment_filename_from_set("/lib", "asset", ".blend", existing)
+        self.assertEqual(first.name, "asset_001.blend")
+        self.assertEqual(second.name, "asset_002.blend")
+
+    def test_empty_name_raises(self):
+        with self.assertRaises(ValueError):
+            increment_filename_from_set("/lib", "", ".blend", set())
+
+
+class TestCollectCompanionsForFile(unittest.TestCase):
+    def _make_library(self, root):
+        (root / "rock.blend").touch()
+        (root / "rock.png").touch()
+        (root / "rock.json").touch()
+        (root / "textures").mkdir()
+        (root / "rock").mkdir()
+        (root / "blender_assets.cats.txt").touch()
+
+    def _names(self, items):
+        return {os.path.normcase(os.path.basename(item)) for item in items}
+
+    def test_scans_folder_when_no_listing_given(self):
+        with tempfile.TemporaryDirectory() as d:
+            root = Path(d)
+            self._make_library(root)
+            names = self._names(collect_companions_for_file(root / "rock.blend"))
+            for expected in ("rock.png", "rock.json", "textures", "rock"):
+                self.assertIn(os.path.normcase(expected), names)
+
+    def test_never_collects_catalog_file(self):
+        with tempfile.TemporaryDirectory() as d:
+            root = Path(d)
+            self._make_library(root)
+            names = self._names(collect_companions_for_file(root / "rock.blend"))
+            self.assertNotIn(os.path.normcase("blender_assets.cats.txt"), names)
+            self.assertNotIn(os.path.normcase("rock.blend"), names)
+
+    def test_listing_matches_own_scan(self):
+        with tempfile.TemporaryDirectory() as d:
+            root = Path(d)
+            self._make_library(root)
+            listing = scan_companion_folder(root)
+            self.assertEqual(
+                sorted(collect_companions_for_file(root / "rock.blend", listing)),
+                sorted(collect_companions_for_file(root / "rock.blend")),
+            )
+
+    def test_missing_folder_returns_empty(self):
+        with tempfile.TemporaryDirectory() as d:
+            self.assertEqual(collect_companions_for_file(Path(d) / "missing" / "rock.blend"), [])
+
+
+class TestBlendDataCollections(unittest.TestCase):
+    def test_subset_of_all_collections(self):
+        self.assertTrue(BLEND_DATA_COLLECTIONS <= set(ALL_DATABLOCK_COLLECTIONS))
+
+    def test_names_exist_on_bpy_data(self):
+        import bpy
+        for name in BLEND_DATA_COLLECTIONS:
+            self.assertTrue(hasattr(bpy.data, name), name)
+
+    def test_core_collections_present(self):
+        for name in ("objects", "materials", "meshes"):
+            self.assertIn(name, BLEND_DATA_COLLECTIONS)
@@ -5,8 +5,15 @@ Creates real Blender datablocks, writes them, and verifies the output.
 import unittest
 import tempfile
 from pathlib import Path
+from unittest import mock
 import bpy
-from QuickAssetSaver.operators.file_io import write_blend_file, count_assets_in_blend
+from QuickAssetSaver.operators import file_io
+from QuickAssetSaver.operators.file_io import (
+    write_blend_file,
+    count_assets_in_blend,
+    count_assets_in_blends,
+    collect_external_dependencies,
+)
 from tests.fixtures import make_test_asset, remove_test_asset, make_compositor_asset, remove_compositor_asset
 
 
@@ -129,6 +136,82 @@ class TestCountAssetsInBlend(unittest.TestCase):
         result = count_assets_in_blend(Path("/nonexistent/file.blend"))
         self.assertEqual(result["count"], 0)
 
+    def test_count_refreshes_after_file_is_rewritten(self):
+        obj2 = make_test_asset(name="QAM_CountTest2")
+        try:
+            with tempfile.TemporaryDirectory() as d:
+                out = Path(d) / "count.blend"
+                write_blend_file(out, {self.obj})
+                first = count_assets_in_blend(out)["count"]
+                write_blend_file(out, {self.obj, obj2})
+                self.assertGreater(count_assets_in_blend(out)["count"], first)
+        finally:
+            remove_test_asset(obj2)
+
+    def test_batch_counts_each_path_once(self):
+        with tempfile.TemporaryDirectory() as d:
+            out = Path(d) / "count.blend"
+            missing = Path(d) / "missing.blend"
+            write_blend_file(out, {self.obj})
+            results = count_assets_in_blends([out, missing, out])
+            self.assertEqual(list(results), [out, missing])
+            self.assertEqual(results[out]["count"], count_assets_in_blend(out)["count"])
+            self.assertEqual(results[missing]["count"], 0)
+
+    def test_failed_read_is_not_cached(self):
+        with tempfile.TemporaryDirectory() as d:
+            bad = Path(d) / "broken.blend"
+            bad.write_bytes(b"not a blend file" * 16)
+            self.assertEqual(count_assets_in_blend(bad)["count"], 0)
+            self.assertNotIn(str(bad), file_io._ASSET_COUNT_CACHE)
+
+    def test_cache_is_capped(self):
+        with tempfile.TemporaryDirectory() as d:
+            paths = [Path(d) / f"count_{i}.blend" for i in range(3)]
+            for path in paths:
+                write_blend_file(path, {self.obj})
+            with mock.patch.dict(file_io._ASSET_COUNT_CACHE, clear=True), \
+                    mock.patch.object(file_io, "ASSET_COUNT_CACHE_SIZE", 2):
+                for path in paths:
+                    self.assertGreater(count_assets_in_blend(path)["count"], 0)
+                self.assertEqual(len(file_io._ASSET_COUNT_CACHE), 2)
+                self.assertNotIn(str(paths[0]), file_io._ASSET_COUNT_CACHE)
+
+
+class TestCollectExternalDependencies(unittest.TestCase):
+    """Two objects sharing a material must both report its image, also when
+    the second lookup is answered from a shared cache."""
+
+    def setUp(self):
+        self.image = bpy.data.images.new("QAM_DepImage", 4, 4)
+        self.mat = bpy.data.materials.new("QAM_DepMaterial")
+        self.mat.use_nodes = True
+        tex_node = self.mat.node_tree.nodes.new("ShaderNodeTexImage")
+        tex_node.image = self.image
+        self.objs = []
+        for name in ("QAM_DepObjA", "QAM_DepObjB"):
+            mesh = bpy.data.meshes.new(name)
+            mesh.materials.append(self.mat)
+            self.objs.append(bpy.data.objects.new(name, mesh))
+
+    def tearDown(self):
+        for obj in self.objs:
+            mesh = obj.data
+            bpy.data.objects.remove(obj)
+            bpy.data.meshes.remove(mesh)
+        bpy.data.materials.remove(self.mat)
+        bpy.data.images.remove(self.image)
+
+    def test_finds_image_through_material(self):
+        deps = collect_external_dependencies(self.objs[0])
+        self.assertIn(self.image, deps["images"])
+
+    def test_shared_cache_still_reports_shared_material(self):
+        cache = {}
+        for obj in self.objs:
+            deps = collect_external_dependencies(obj, cache)
+            self.assertIn(self.image, deps["images"])
+
 
 class TestWriteBlendCompositorAssets(unittest.TestCase):
     """Regression test for issue #14: a compositor node group asset with a